@@ -38,6 +38,7 @@ class RectROI:
         self.temp_max: Optional[float] = None
         self.temp_mean: Optional[float] = None
         self.temp_std: Optional[float] = None
+        self.temp_median: Optional[float] = None
     
     def get_bounds(self):
         """
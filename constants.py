@@ -5,6 +5,9 @@ and their corresponding matplotlib colormap objects. This allows for easy
 management and extension of available color schemes.
 """
 
+from functools import lru_cache
+
+import numpy as np
 import matplotlib.cm as cm
 
 # PALETTE_MAP: A dictionary mapping human-readable names to matplotlib colormaps.
@@ -52,4 +55,57 @@ PALETTE_MAP = {
     "Greens": cm.Greens,
     "Oranges": cm.Oranges,
     "Reds": cm.Reds,
-}
\ No newline at end of file
+}
+
+# PALETTE_NAMES: Palette names in display order, for populating selectors.
+PALETTE_NAMES = tuple(PALETTE_MAP)
+
+
+@lru_cache(maxsize=None)
+def get_lut(name, inverted=False):
+    """Return the 8-bit RGB lookup table for a palette.
+
+    The table samples every entry of the colormap's own color table, so
+    indexing it with scaled integer data matches calling the colormap on
+    normalized data. Tables are built on first use and shared afterwards.
+
+    Args:
+        name (str): Palette name; unknown names fall back to "Iron".
+        inverted (bool): Whether to reverse the palette.
+
+    Returns:
+        np.ndarray: Read-only (N, 3) uint8 array of RGB colors.
+    """
+    if inverted:
+        # Reverse the cached forward table instead of sampling matplotlib again
+        lut = np.ascontiguousarray(get_lut(name)[::-1])
+    else:
+        cmap = PALETTE_MAP.get(name, cm.inferno)
+        lut = (cmap(np.arange(cmap.N))[:, :3] * 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=None)
+def get_rgb32_lut(name, inverted=False):
+    """Return a palette as packed 0xffRRGGBB values.
+
+    This is the pixel layout of QImage.Format_RGB32 and of QImage color
+    tables, so images colored through it need no format conversion when
+    they are turned into pixmaps.
+
+    Args:
+        name (str): Palette name; unknown names fall back to "Iron".
+        inverted (bool): Whether to reverse the palette.
+
+    Returns:
+        np.ndarray: Read-only (N,) uint32 array of packed colors.
+    """
+    if inverted:
+        packed = np.ascontiguousarray(get_rgb32_lut(name)[::-1])
+    else:
+        rgb = get_lut(name).astype(np.uint32)
+        packed = 0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        packed = packed.astype(np.uint32)
+    packed.setflags(write=False)
+    return packed
@@ -6,13 +6,72 @@ Region of Interest (ROI) operations, statistics calculation, and coordination
 with the thermal engine for temperature analysis.
 """
 
+import logging
+
 import numpy as np
 from typing import List, Optional, Dict, Any
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QColor
 
 from analysis.roi_models import RectROI, SpotROI, PolygonROI
 
+# Column order of the per-ROI statistics array (see ROIController._roi_stats)
+STAT_FIELDS = ("temp_min", "temp_max", "temp_mean", "temp_std", "temp_median")
+
+# Per-ROI progress messages; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class _StatisticsNotifier(QObject):
+    """Carries results from statistics workers back to the GUI thread."""
+    
+    finished = Signal(object, object)  # token, statistics tuple or None
+
+
+class _RoiStatisticsTask(QRunnable):
+    """
+    Compute the temperature statistics of one ROI on a QThreadPool worker.
+    
+    The pixels and a snapshot of the image state are taken on the GUI thread;
+    the worker only reads the snapshot, so loading another image meanwhile
+    cannot change the data under it, and the per-pixel Planck math and
+    reductions (which release the GIL inside NumPy) run without blocking
+    the interface.
+    """
+    
+    def __init__(self, thermal_engine, snapshot: dict, roi_pixels: np.ndarray,
+                 emissivity: float, token: tuple, notifier: _StatisticsNotifier):
+        """
+        Initialize the task.
+        
+        Args:
+            thermal_engine: ThermalEngine providing the temperature tables.
+            snapshot (dict): Image state from ThermalEngine.get_roi_data_snapshot.
+            roi_pixels (np.ndarray): Flat indices of the ROI pixels.
+            emissivity (float): ROI emissivity.
+            token (tuple): Identifies the request when the result comes back.
+            notifier (_StatisticsNotifier): Emits the result.
+        """
+        super().__init__()
+        self._thermal_engine = thermal_engine
+        self._snapshot = snapshot
+        self._roi_pixels = roi_pixels
+        self._emissivity = emissivity
+        self._token = token
+        self._notifier = notifier
+    
+    def run(self):
+        """Compute the statistics and emit them with the request token."""
+        stats = None
+        try:
+            stats = ROIController._compute_roi_statistics(
+                self._thermal_engine, self._roi_pixels, self._emissivity,
+                self._snapshot
+            )
+        except Exception as e:
+            print(f"❌ Error computing ROI statistics in background: {e}")
+        self._notifier.finished.emit(self._token, stats)
+
 
 class ROIController(QObject):
     """
@@ -44,12 +103,33 @@ class ROIController(QObject):
         self.rois: List[Any] = []
         self._next_roi_id = 1
         
+        # Structure-of-arrays statistics storage: row i holds STAT_FIELDS for
+        # self.rois[i] (NaN when unavailable), so batch updates and table/export
+        # readers work on one contiguous array instead of per-object attributes.
+        # _roi_stats is a view of the first len(self.rois) rows of a buffer
+        # grown geometrically (see _resize_statistics)
+        self._roi_stats_buffer = np.full((0, len(STAT_FIELDS)), np.nan)
+        self._roi_stats = self._roi_stats_buffer
+        
         # Default color scheme for ROIs
         self._color_hue_step = 55
         
         # Performance optimization: prevent spam during updates
         self._updating_statistics = False
         self._pending_updates = set()  # Track ROIs that need update
+        self._defer_statistics = False  # Set while importing in bulk
+        
+        # Flat pixel indices per ROI id, as (key, indices) where the key is
+        # the image shape and ROI geometry the indices were computed for
+        self._pixel_index_cache = {}
+        
+        # Background statistics: the latest request serial per ROI id, so
+        # results superseded by a newer request (or a synchronous update)
+        # are dropped when they arrive
+        self._stats_serial = 0
+        self._stats_requests = {}
+        self._stats_notifier = _StatisticsNotifier(self)
+        self._stats_notifier.finished.connect(self._on_background_statistics_ready)
 
     def set_thermal_engine(self, thermal_engine):
         """
@@ -84,8 +164,8 @@ class ROIController(QObject):
         roi_model.emissivity = emissivity
         roi_model.color = self._generate_roi_color()
         
-        self.rois.append(roi_model)
-        self._update_roi_statistics(roi_model)
+        row = self._append_roi(roi_model)
+        self._update_roi_statistics(roi_model, row)
         
         self.roi_added.emit(roi_model)
         return roi_model
@@ -113,8 +193,8 @@ class ROIController(QObject):
         roi_model.emissivity = emissivity
         roi_model.color = self._generate_roi_color()
         
-        self.rois.append(roi_model)
-        self._update_roi_statistics(roi_model)
+        row = self._append_roi(roi_model)
+        self._update_roi_statistics(roi_model, row)
         
         self.roi_added.emit(roi_model)
         return roi_model
@@ -140,8 +220,8 @@ class ROIController(QObject):
         roi_model.emissivity = emissivity
         roi_model.color = self._generate_roi_color()
         
-        self.rois.append(roi_model)
-        self._update_roi_statistics(roi_model)
+        row = self._append_roi(roi_model)
+        self._update_roi_statistics(roi_model, row)
         
         self.roi_added.emit(roi_model)
         return roi_model
@@ -159,8 +239,10 @@ class ROIController(QObject):
         for i, roi in enumerate(self.rois):
             if roi.id == roi_id:
                 removed_roi = self.rois.pop(i)
+                self._set_statistics_block(np.delete(self._roi_stats, i, axis=0))
+                self._pixel_index_cache.pop(roi_id, None)
                 self.roi_removed.emit(str(roi_id))
-                print(f"Deleted ROI: {removed_roi.name}")
+                log.debug("Deleted ROI: %s", removed_roi.name)
                 return True
         return False
 
@@ -174,12 +256,23 @@ class ROIController(QObject):
         Returns:
             int: Number of ROIs successfully deleted.
         """
-        deleted_count = 0
-        # Sort by index in reverse order to avoid index shifting issues
-        for roi_id in roi_ids:
-            if self.delete_roi(roi_id):
-                deleted_count += 1
-        return deleted_count
+        # One pass over the ROIs and a single statistics-array rebuild,
+        # instead of a search and an np.delete copy per deleted ROI
+        ids = set(roi_ids)
+        rows = [i for i, roi in enumerate(self.rois) if roi.id in ids]
+        if not rows:
+            return 0
+        
+        removed = [self.rois[i] for i in rows]
+        self._set_statistics_block(np.delete(self._roi_stats, rows, axis=0))
+        self.rois = [roi for roi in self.rois if roi.id not in ids]
+        for roi_id in ids:
+            self._pixel_index_cache.pop(roi_id, None)
+        
+        for roi in removed:
+            self.roi_removed.emit(str(roi.id))
+            log.debug("Deleted ROI: %s", roi.name)
+        return len(removed)
 
     def clear_all_rois(self) -> int:
         """
@@ -190,9 +283,11 @@ class ROIController(QObject):
         """
         count = len(self.rois)
         self.rois.clear()
+        self._set_statistics_block(np.full((0, len(STAT_FIELDS)), np.nan))
+        self._pixel_index_cache.clear()
         self._next_roi_id = 1
         self.rois_cleared.emit()
-        print(f"Cleared {count} ROIs")
+        log.debug("Cleared %d ROIs", count)
         return count
 
     def update_roi(self, roi_id: str, **kwargs) -> bool:
@@ -215,10 +310,10 @@ class ROIController(QObject):
             if hasattr(roi, key):
                 setattr(roi, key, value)
                 
-        # Recalculate statistics if emissivity changed
+        # Recalculate statistics if emissivity changed; the result arrives
+        # through analysis_updated once the worker is done
         if 'emissivity' in kwargs:
-            self._update_roi_statistics(roi)
-            self.analysis_updated.emit()  # Emit to trigger UI refresh for statistics changes
+            self._update_roi_statistics_in_background(roi)
             
         self.roi_modified.emit(roi)
         return True
@@ -264,7 +359,7 @@ class ROIController(QObject):
         self.roi_modified.emit(roi)
         self.analysis_updated.emit()  # Also emit this to trigger UI refresh
         
-        print(f"✅ Updated geometry for ROI {roi.name} (ID: {roi_id})")
+        log.debug("Updated geometry for ROI %s (ID: %s)", roi.name, roi_id)
         return True
 
     def get_roi_by_id(self, roi_id: str) -> Optional[Any]:
@@ -291,79 +386,159 @@ class ROIController(QObject):
         """
         return self.rois.copy()
 
+    def get_statistics_array(self) -> np.ndarray:
+        """
+        Get the statistics of all ROIs as a single array.
+        
+        Returns:
+            np.ndarray: Read-only (N, len(STAT_FIELDS)) array whose row i
+                        holds the statistics of get_all_rois()[i], NaN where
+                        unavailable.
+        """
+        view = self._roi_stats.view()
+        view.flags.writeable = False
+        return view
+
     def update_all_analyses(self):
         """Update temperature statistics for all ROIs."""
-        for roi in self.rois:
-            self._update_roi_statistics(roi)
+        # Clear the block in place, then refill it row by row; the rows are
+        # known here, so no per-ROI list search is needed
+        self._resize_statistics(len(self.rois))
+        self._roi_stats.fill(np.nan)
+        for row, roi in enumerate(self.rois):
+            self._update_roi_statistics(roi, row)
         self.analysis_updated.emit()
 
-    def _update_roi_statistics(self, roi):
+    def _append_roi(self, roi) -> int:
+        """
+        Add an ROI model together with an empty row of statistics.
+        
+        While importing in bulk only the model is added; import_roi_data
+        sizes the statistics block once at the end.
+        
+        Args:
+            roi: ROI model to add.
+            
+        Returns:
+            int: Row of the new ROI.
+        """
+        self.rois.append(roi)
+        if not self._defer_statistics:
+            self._resize_statistics(len(self.rois))
+        return len(self.rois) - 1
+
+    def _resize_statistics(self, count: int):
+        """
+        Resize the statistics block to count rows, new rows set to NaN.
+        
+        The backing buffer grows geometrically, so adding ROIs one at a
+        time copies the existing rows only O(log N) times.
+        
+        Args:
+            count (int): Number of rows (ROIs).
+        """
+        old_count = self._roi_stats.shape[0]
+        buffer = self._roi_stats_buffer
+        if count > buffer.shape[0]:
+            capacity = max(count, 2 * buffer.shape[0], 8)
+            buffer = np.full((capacity, len(STAT_FIELDS)), np.nan)
+            kept = min(old_count, count)
+            buffer[:kept] = self._roi_stats[:kept]
+            self._roi_stats_buffer = buffer
+        self._roi_stats = buffer[:count]
+        if count > old_count:
+            self._roi_stats[old_count:] = np.nan
+
+    def _set_statistics_block(self, block: np.ndarray):
+        """
+        Replace the statistics block (and its buffer) with an exact-size array.
+        
+        Args:
+            block (np.ndarray): (len(self.rois), len(STAT_FIELDS)) array.
+        """
+        self._roi_stats_buffer = block
+        self._roi_stats = block
+
+    def _set_roi_statistics(self, roi, stats: Optional[tuple], row: Optional[int] = None):
+        """
+        Store the statistics of an ROI in the statistics array and on the model.
+        
+        Args:
+            roi: ROI model to update.
+            stats (tuple, optional): Values in STAT_FIELDS order, or None when
+                                     no statistics are available.
+            row (int, optional): Row of the ROI, when the caller knows it;
+                                 looked up in self.rois otherwise.
+        """
+        if row is None:
+            try:
+                row = self.rois.index(roi)
+            except ValueError:
+                row = None
+        if row is not None and row < self._roi_stats.shape[0]:
+            self._roi_stats[row] = np.nan if stats is None else stats
+            
+        # Mirror onto the model for labels and exports that read attributes
+        for field_index, field in enumerate(STAT_FIELDS):
+            setattr(roi, field, None if stats is None else stats[field_index])
+
+    def _update_roi_statistics(self, roi, row: Optional[int] = None):
         """
         Update temperature statistics for a single ROI.
         
         Args:
             roi: ROI model to update.
+            row (int, optional): Row of the ROI in self.rois, if known.
         """
+        # Bulk imports compute every ROI once at the end (see import_roi_data)
+        if self._defer_statistics:
+            return
+            
         # Prevent recursive updates or spam during batch operations
         if self._updating_statistics:
             self._pending_updates.add(roi.id)
             return
+        
+        # This result supersedes any background computation still running
+        self._stats_requests.pop(roi.id, None)
             
         if self.thermal_engine is None:
             print(f"⚠️ No thermal engine available for ROI {roi.name}")
-            roi.temp_min = roi.temp_max = roi.temp_mean = None
-            roi.temp_std = roi.temp_median = None
+            self._set_roi_statistics(roi, None, row)
             return
             
         if self.thermal_engine.thermal_data is None:
             print(f"⚠️ No thermal data available for ROI {roi.name}")
-            roi.temp_min = roi.temp_max = roi.temp_mean = None
-            roi.temp_std = roi.temp_median = None
+            self._set_roi_statistics(roi, None, row)
             return
             
         self._updating_statistics = True
         try:
-            # Create mask for this ROI
-            roi_mask = self._create_roi_mask(roi)
-            if roi_mask is None:
+            # Pixels of this ROI (cached until its geometry changes)
+            roi_pixels = self._get_roi_pixel_indices(roi)
+            if roi_pixels is None:
                 print(f"⚠️ Failed to create mask for ROI {roi.name}")
-                roi.temp_min = roi.temp_max = roi.temp_mean = None
-                roi.temp_std = roi.temp_median = None
+                self._set_roi_statistics(roi, None, row)
                 
-            elif not np.any(roi_mask):
+            elif roi_pixels.size == 0:
                 print(f"⚠️ Empty mask for ROI {roi.name} - ROI might be outside image bounds")
-                roi.temp_min = roi.temp_max = roi.temp_mean = None
-                roi.temp_std = roi.temp_median = None
+                self._set_roi_statistics(roi, None, row)
                 
             else:
-                # Get temperature values for ROI
                 roi_emissivity = getattr(roi, 'emissivity', 0.95)
-                temps = self.thermal_engine.compute_roi_temperatures(roi_mask, roi_emissivity)
-                
-                if temps.size > 0:
-                    valid_temps = temps[~np.isnan(temps)]
-                    if valid_temps.size > 0:
-                        roi.temp_min = float(np.min(valid_temps))
-                        roi.temp_max = float(np.max(valid_temps))
-                        roi.temp_mean = float(np.mean(valid_temps))
-                        roi.temp_std = float(np.std(valid_temps))
-                        roi.temp_median = float(np.median(valid_temps))
-                        # Statistics updated successfully (reduced logging for performance)
-                    else:
-                        print(f"⚠️ All temperature values are NaN for ROI {roi.name}")
-                        roi.temp_min = roi.temp_max = roi.temp_mean = None
-                        roi.temp_std = roi.temp_median = None
+                stats = self._compute_roi_statistics(self.thermal_engine, roi_pixels, roi_emissivity)
+                if stats is not None:
+                    self._set_roi_statistics(roi, stats, row)
+                    # Statistics updated successfully (reduced logging for performance)
                 else:
-                    print(f"⚠️ No temperature values computed for ROI {roi.name}")
-                    roi.temp_min = roi.temp_max = roi.temp_mean = None
-                    roi.temp_std = roi.temp_median = None
+                    print(f"⚠️ No valid temperature values for ROI {roi.name}")
+                    self._set_roi_statistics(roi, None, row)
                 
         except Exception as e:
             print(f"❌ Error updating ROI statistics for {roi.name}: {e}")
             import traceback
             traceback.print_exc()
-            roi.temp_min = roi.temp_max = roi.temp_mean = None
-            roi.temp_std = roi.temp_median = None
+            self._set_roi_statistics(roi, None, row)
         finally:
             self._updating_statistics = False
             
@@ -376,9 +551,223 @@ class ROIController(QObject):
                 for pending_roi_id in pending_roi_ids:
                     pending_roi = self.get_roi_by_id(pending_roi_id)
                     if pending_roi and pending_roi != roi:  # Avoid immediate re-calculation of same ROI
-                        print(f"⏰ Processing deferred update for ROI {pending_roi.name}")
+                        log.debug("Processing deferred update for ROI %s", pending_roi.name)
                         self._update_roi_statistics(pending_roi)
 
+    def _update_roi_statistics_in_background(self, roi):
+        """
+        Recompute an ROI's statistics on the global thread pool.
+        
+        Falls back to the synchronous update when there is nothing to
+        compute (no data or no pixels), which also reports the reason.
+        
+        Args:
+            roi: ROI model to update.
+        """
+        roi_pixels = None
+        if self.thermal_engine is not None and self.thermal_engine.thermal_data is not None:
+            roi_pixels = self._get_roi_pixel_indices(roi)
+        if roi_pixels is None or roi_pixels.size == 0:
+            self._update_roi_statistics(roi)
+            self.analysis_updated.emit()
+            return
+        
+        self._stats_serial += 1
+        self._stats_requests[roi.id] = self._stats_serial
+        token = (roi.id, self._stats_serial, self.thermal_engine.thermal_data)
+        snapshot = self.thermal_engine.get_roi_data_snapshot(detach=True)
+        task = _RoiStatisticsTask(self.thermal_engine, snapshot, roi_pixels,
+                                  getattr(roi, 'emissivity', 0.95),
+                                  token, self._stats_notifier)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_background_statistics_ready(self, token: tuple, stats: Optional[tuple]):
+        """
+        Store statistics computed by a background task.
+        
+        Args:
+            token (tuple): (roi_id, serial, thermal_data) of the request.
+            stats (tuple, optional): Computed statistics, None on failure.
+        """
+        roi_id, serial, thermal_data = token
+        if self._stats_requests.get(roi_id) != serial:
+            return  # Superseded by a newer request
+        del self._stats_requests[roi_id]
+        
+        # Drop results for an image that has since been replaced or an ROI
+        # that has since been deleted
+        if self.thermal_engine is None or self.thermal_engine.thermal_data is not thermal_data:
+            return
+        roi = self.get_roi_by_id(roi_id)
+        if roi is None:
+            return
+        
+        self._set_roi_statistics(roi, stats)
+        self.analysis_updated.emit()
+
+    @staticmethod
+    def _compute_roi_statistics(thermal_engine, roi_pixels: np.ndarray,
+                                emissivity: float, snapshot: dict = None) -> Optional[tuple]:
+        """
+        Compute the statistics of the given ROI pixels at an emissivity.
+        
+        Large ROIs are reduced from the engine's raw-value histogram; the
+        rest from their per-pixel temperatures.
+        
+        Args:
+            thermal_engine: ThermalEngine providing the temperatures.
+            roi_pixels (np.ndarray): Flat indices of the ROI pixels.
+            emissivity (float): ROI emissivity.
+            snapshot (dict, optional): Image state to compute from; taken
+                                       from the engine if not given.
+            
+        Returns:
+            tuple or None: Values in STAT_FIELDS order, None if no pixel has
+                           a valid temperature.
+        """
+        if snapshot is None:
+            snapshot = thermal_engine.get_roi_data_snapshot()
+            if snapshot is None:
+                return None
+        
+        histogram = thermal_engine.compute_roi_temperature_histogram(
+            roi_pixels, emissivity, snapshot
+        )
+        if histogram is not None:
+            return ROIController._statistics_from_histogram(*histogram)
+        
+        temps = thermal_engine.compute_roi_temperatures(roi_pixels, emissivity, snapshot)
+        if temps.size == 0:
+            return None
+        # temps is a fresh array owned here; the statistics are computed on
+        # it in place, NaNs included
+        return ROIController._compute_statistics(temps)
+
+    @staticmethod
+    def _statistics_from_histogram(values: np.ndarray, counts: np.ndarray) -> Optional[tuple]:
+        """
+        Compute min, max, mean, std and median from weighted temperatures.
+        
+        Gives the same results as _compute_statistics over the expanded
+        pixels, but works on at most one entry per distinct raw value.
+        
+        Args:
+            values (np.ndarray): Temperature of each raw value (NaN if invalid).
+            counts (np.ndarray): Number of ROI pixels with that raw value.
+            
+        Returns:
+            tuple or None: (min, max, mean, std, median) as Python floats,
+                           or None if no pixel has a valid temperature.
+        """
+        valid = (counts > 0) & np.isfinite(values)
+        values = values[valid].astype(np.float64)
+        counts = counts[valid]
+        n = int(counts.sum())
+        if n == 0:
+            return None
+        
+        order = np.argsort(values)
+        values = values[order]
+        counts = counts[order]
+        
+        # The k-th smallest pixel value lies in the first bin whose
+        # cumulative count exceeds k
+        cumulative = np.cumsum(counts)
+        mid = n // 2
+        upper = values[np.searchsorted(cumulative, mid, side="right")]
+        if n % 2:
+            median = upper
+        else:
+            median = 0.5 * (values[np.searchsorted(cumulative, mid - 1, side="right")] + upper)
+        
+        mean = np.dot(counts, values) / n
+        variance = np.dot(counts, values * values) / n - mean * mean
+        std = np.sqrt(max(variance, 0.0))
+        return (float(values[0]), float(values[-1]), float(mean),
+                float(std), float(median))
+
+    @staticmethod
+    def _compute_statistics(values: np.ndarray) -> Optional[tuple]:
+        """
+        Compute min, max, mean, std and median of ROI temperatures.
+        
+        A single introselect (np.partition) places the minimum, the
+        maximum and the median element(s) at their sorted positions in
+        O(n), instead of a full O(n log n) sort. NaNs sort after every
+        number, so the partition also moves them past the last valid value
+        and the valid values are a prefix view rather than a filtered copy.
+        Mean and std come from the sum and the sum of squares (a dot
+        product), so no deviation array is materialized.
+        
+        Args:
+            values (np.ndarray): 1-D array of temperatures, possibly with
+                                 NaNs. Float64 input is reordered in place.
+            
+        Returns:
+            tuple or None: (min, max, mean, std, median) as Python floats,
+                           or None if every value is NaN.
+        """
+        # Temperatures are stored as float32; accumulate in float64 so the
+        # sum of squares doesn't lose the variance to cancellation. Float32
+        # input gets its working copy here, float64 input is used as is.
+        work = values.astype(np.float64, copy=False)
+        n = work.size - int(np.count_nonzero(np.isnan(work)))
+        if n == 0:
+            return None
+        mid = n // 2
+        kth = {0, mid, n - 1}
+        if n % 2 == 0:
+            kth.add(mid - 1)
+        work.partition(sorted(kth))
+        work = work[:n]
+        
+        if n % 2:
+            median = work[mid]
+        else:
+            median = 0.5 * (work[mid - 1] + work[mid])
+        mean = work.sum() / n
+        variance = np.dot(work, work) / n - mean * mean
+        std = np.sqrt(max(variance, 0.0))
+        return (float(work[0]), float(work[-1]), float(mean),
+                float(std), float(median))
+
+    def _get_roi_pixel_indices(self, roi) -> Optional[np.ndarray]:
+        """
+        Get the flat indices of the image pixels covered by an ROI.
+        
+        The indices only depend on the ROI geometry and the image shape, so
+        they are cached per ROI and statistics updates that only change the
+        emissivity (or the image, at the same size) skip rebuilding the mask.
+        
+        Args:
+            roi: ROI model.
+            
+        Returns:
+            np.ndarray or None: Read-only flat pixel indices, None if the
+                                mask could not be created.
+        """
+        key = (self.thermal_engine.thermal_data.shape, self._geometry_key(roi))
+        cached = self._pixel_index_cache.get(roi.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        roi_mask = self._create_roi_mask(roi)
+        if roi_mask is None:
+            return None
+        indices = np.flatnonzero(roi_mask)
+        indices.flags.writeable = False
+        self._pixel_index_cache[roi.id] = (key, indices)
+        return indices
+
+    @staticmethod
+    def _geometry_key(roi) -> tuple:
+        """Describe the geometry of an ROI as a hashable, comparable tuple."""
+        if isinstance(roi, SpotROI):
+            return ("spot", roi.x, roi.y, roi.radius)
+        if isinstance(roi, PolygonROI):
+            return ("polygon", tuple(tuple(point) for point in roi.points))
+        return ("rect", roi.x, roi.y, roi.width, roi.height)
+
     def _create_roi_mask(self, roi) -> Optional[np.ndarray]:
         """
         Create a boolean mask for an ROI.
@@ -408,9 +797,13 @@ class ROIController(QObject):
                     return mask  # Return empty mask
                 
                 if x1 < x2 and y1 < y2:
+                    # Squared offsets stay 1-D (open grid); only their broadcast
+                    # sum is 2-D, and the comparison writes straight into the mask
                     y_indices, x_indices = np.ogrid[y1:y2, x1:x2]
-                    circle_mask = ((x_indices - roi.x) ** 2 + (y_indices - roi.y) ** 2) <= (roi.radius ** 2)
-                    mask[y1:y2, x1:x2] = circle_mask
+                    dx = x_indices - roi.x
+                    dy = y_indices - roi.y
+                    np.less_equal(dx * dx + dy * dy, roi.radius * roi.radius,
+                                  out=mask[y1:y2, x1:x2])
                     
             elif isinstance(roi, PolygonROI):
                 # Polygon mask - optimized version using vectorized operations
@@ -424,16 +817,8 @@ class ROIController(QObject):
                     return mask  # Return empty mask
                 
                 if x1 < x2 and y1 < y2:
-                    # Create vectorized coordinate grids for the bounding box
-                    y_coords, x_coords = np.mgrid[y1:y2, x1:x2]
-                    
-                    # Vectorized ray casting algorithm for polygon
-                    mask_section = self._polygon_contains_points_vectorized(
-                        roi.points, x_coords.flatten(), y_coords.flatten()
-                    )
-                    
-                    # Reshape back to 2D and assign to mask
-                    mask[y1:y2, x1:x2] = mask_section.reshape(y2-y1, x2-x1)
+                    # Scanline fill of the bounding box
+                    mask[y1:y2, x1:x2] = self._rasterize_polygon(roi.points, x1, y1, x2, y2)
                                 
             else:
                 # Rectangular mask (default)
@@ -463,48 +848,50 @@ class ROIController(QObject):
             traceback.print_exc()
             return None
 
-    def _polygon_contains_points_vectorized(self, polygon_points, x_coords, y_coords):
+    @staticmethod
+    def _rasterize_polygon(polygon_points, x1: int, y1: int, x2: int, y2: int) -> np.ndarray:
         """
-        Vectorized ray casting algorithm for polygon point-in-polygon test.
+        Rasterize a polygon over a pixel window with an even-odd scanline fill.
+        
+        For every row the crossings with all edges are computed at once;
+        each crossing toggles the inside state from the first pixel at or
+        past it, and a running sum along the row resolves the state of every
+        pixel. This costs O(rows * edges + pixels), instead of testing every
+        pixel against every edge. Edges are half-open in y and pixels are
+        inside from the crossing onwards, so a polygon covering [a, b) in
+        either axis fills pixels a to b - 1, like the rectangle mask.
         
         Args:
-            polygon_points: List of (x, y) tuples defining polygon vertices
-            x_coords: Flattened array of x coordinates to test
-            y_coords: Flattened array of y coordinates to test
+            polygon_points: List of (x, y) tuples defining polygon vertices.
+            x1, y1 (int): Top-left pixel of the window.
+            x2, y2 (int): Exclusive bottom-right pixel of the window.
             
         Returns:
-            np.ndarray: Boolean array indicating which points are inside polygon
+            np.ndarray: Boolean (y2 - y1, x2 - x1) mask of pixels inside the polygon.
         """
+        height, width = y2 - y1, x2 - x1
         if len(polygon_points) < 3:
-            return np.zeros_like(x_coords, dtype=bool)
+            return np.zeros((height, width), dtype=bool)
         
-        # Convert polygon points to numpy arrays for vectorized operations
-        polygon_points = np.array(polygon_points)
-        n_vertices = len(polygon_points)
+        points = np.asarray(polygon_points, dtype=np.float64)
+        ex0, ey0 = points[:, 0], points[:, 1]
+        ex1, ey1 = np.roll(ex0, -1), np.roll(ey0, -1)
         
-        # Initialize result array
-        inside = np.zeros_like(x_coords, dtype=bool)
+        # (row, edge) pairs whose edge spans the row's y; horizontal edges
+        # never qualify, so the division below is safe
+        ys = np.arange(y1, y2, dtype=np.float64)[:, None]
+        rows, edges = np.nonzero((ey0 <= ys) != (ey1 <= ys))
+        x_cross = ex0[edges] + (ys[rows, 0] - ey0[edges]) * (
+            (ex1[edges] - ex0[edges]) / (ey1[edges] - ey0[edges])
+        )
         
-        # Ray casting algorithm - vectorized version
-        j = n_vertices - 1
-        for i in range(n_vertices):
-            xi, yi = polygon_points[i]
-            xj, yj = polygon_points[j]
-            
-            # Vectorized conditions for ray casting
-            condition1 = (yi > y_coords) != (yj > y_coords)
-            
-            # Avoid division by zero when yj == yi
-            with np.errstate(divide='ignore', invalid='ignore'):
-                condition2 = x_coords < (xj - xi) * (y_coords - yi) / (yj - yi) + xi
-                # Handle division by zero case (horizontal line)
-                condition2 = np.where(yj == yi, False, condition2)
-            
-            # Update inside array where both conditions are true
-            inside = inside ^ (condition1 & condition2)
-            j = i
-            
-        return inside
+        # First pixel column at or past each crossing; crossings left of the
+        # window toggle from column 0, those right of it fall in the spare
+        # last column and never affect a pixel
+        cols = np.clip(np.ceil(x_cross) - x1, 0, width).astype(np.intp)
+        toggles = np.bincount(rows * (width + 1) + cols, minlength=height * (width + 1))
+        inside = np.cumsum(toggles.reshape(height, width + 1)[:, :width], axis=1)
+        return (inside & 1).astype(bool)
 
     def _generate_roi_color(self) -> QColor:
         """
@@ -558,6 +945,33 @@ class ROIController(QObject):
         Returns:
             int: Number of ROIs successfully imported.
         """
+        # Statistics are computed in one batch after the loop rather than
+        # as each ROI is created
+        self._defer_statistics = True
+        try:
+            imported_count = self._import_roi_entries(roi_data_list)
+        finally:
+            self._defer_statistics = False
+            # Imported ROIs were added without statistics rows: size the
+            # block once for all of them
+            self._resize_statistics(len(self.rois))
+            
+        if imported_count and self.thermal_engine is not None and \
+                self.thermal_engine.thermal_data is not None:
+            self.update_all_analyses()
+                
+        return imported_count
+
+    def _import_roi_entries(self, roi_data_list: List[Dict[str, Any]]) -> int:
+        """
+        Create ROIs from serialized entries without computing statistics.
+        
+        Args:
+            roi_data_list (List[Dict[str, Any]]): List of ROI data dictionaries.
+            
+        Returns:
+            int: Number of ROIs successfully created.
+        """
         imported_count = 0
         
         for roi_data in roi_data_list:
@@ -610,26 +1024,28 @@ class ROIController(QObject):
         """
         detailed_data = []
         
-        for roi in self.rois:
+        # Read all statistics from the array in one conversion; NaN marks
+        # unavailable values and is exported as None
+        stats_rows = self._roi_stats.tolist()
+        
+        for row, roi in enumerate(self.rois):
             try:
                 # Get basic ROI data
                 data = {
                     "name": roi.name,
                     "type": roi.__class__.__name__,
                     "emissivity": getattr(roi, 'emissivity', 0.95),
-                    "temp_min": getattr(roi, 'temp_min', None),
-                    "temp_max": getattr(roi, 'temp_max', None),
-                    "temp_mean": getattr(roi, 'temp_mean', None),
-                    "temp_median": getattr(roi, 'temp_median', None),
-                    "temp_std": getattr(roi, 'temp_std', None),
-                    "pixel_count": 0
                 }
+                values = stats_rows[row] if row < len(stats_rows) else [None] * len(STAT_FIELDS)
+                for field, value in zip(STAT_FIELDS, values):
+                    data[field] = None if value is None or value != value else value
+                data["pixel_count"] = 0
                 
                 # Calculate pixel count
                 if self.thermal_engine and self.thermal_engine.thermal_data is not None:
-                    roi_mask = self._create_roi_mask(roi)
-                    if roi_mask is not None:
-                        data["pixel_count"] = int(np.sum(roi_mask))
+                    roi_pixels = self._get_roi_pixel_indices(roi)
+                    if roi_pixels is not None:
+                        data["pixel_count"] = int(roi_pixels.size)
                 
                 detailed_data.append(data)
                 
@@ -7,10 +7,14 @@ palette settings, and overlay configurations.
 """
 
 import json
+import logging
 import os
 from typing import Dict, Any, Optional
 from PySide6.QtCore import QObject, Signal
 
+# Per-save messages; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
 
 class SettingsManager(QObject):
     """
@@ -34,8 +38,13 @@ class SettingsManager(QObject):
         super().__init__()
         
         self.current_image_path = None
+        self._json_path = None  # Derived from current_image_path on first use
         self._ignore_auto_save = False
         
+        # (path, text) of the last file written, so saves that would
+        # reproduce it byte for byte are skipped
+        self._last_saved = None
+        
         # Default settings structure
         self.default_settings = {
             "version": "1.0",
@@ -80,6 +89,8 @@ class SettingsManager(QObject):
             image_path (str): Path to the current thermal image.
         """
         self.current_image_path = image_path
+        self._json_path = None
+        self._last_saved = None
 
     def get_json_file_path(self) -> Optional[str]:
         """
@@ -91,8 +102,11 @@ class SettingsManager(QObject):
         if not self.current_image_path:
             return None
         
-        base_path = os.path.splitext(self.current_image_path)[0]
-        return f"{base_path}.json"
+        # Derived once per image; every autosave asks for it again
+        if self._json_path is None:
+            base_path = os.path.splitext(self.current_image_path)[0]
+            self._json_path = f"{base_path}.json"
+        return self._json_path
 
     def save_settings(self, thermal_parameters: Dict[str, Any] = None,
                      palette_settings: Dict[str, Any] = None,
@@ -170,12 +184,20 @@ class SettingsManager(QObject):
                     "manual_max": temp_range_settings.get("manual_max", 100.0)
                 }
                 
-            # Ensure directory exists and save to file
-            os.makedirs(os.path.dirname(json_path), exist_ok=True)
+            # Serialize once; an unchanged document needs no disk write
+            text = json.dumps(settings_data, indent=2, ensure_ascii=False)
+            if self._last_saved == (json_path, text):
+                return True
+            
+            # Ensure the directory exists on the first write for this path
+            # only; later autosaves go straight to the file
+            if self._last_saved is None or self._last_saved[0] != json_path:
+                os.makedirs(os.path.dirname(json_path), exist_ok=True)
             with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(settings_data, f, indent=2, ensure_ascii=False)
+                f.write(text)
+            self._last_saved = (json_path, text)
             
-            print(f"Settings saved to: {json_path}")
+            log.debug("Settings saved to: %s", json_path)
             self.settings_saved.emit(json_path)
             return True
             
@@ -351,6 +373,7 @@ class SettingsManager(QObject):
             
         try:
             os.remove(json_path)
+            self._last_saved = None
             print(f"Settings file deleted: {json_path}")
             return True
             
@@ -6,17 +6,24 @@ processing, temperature calculations, and image management. It separates the cor
 thermal analysis logic from the UI components.
 """
 
+import base64
 import io
 import json
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
+import warnings
 import numpy as np
 from PIL import Image
 import exiftool
 from PySide6.QtGui import QPixmap, QImage, QPainter, QPen, QBrush, QColor, QPolygonF, QFont
 from PySide6.QtCore import QObject, Signal, Qt, QPointF, QRectF, QRect
 
-from constants import PALETTE_MAP
-import matplotlib.cm as cm
+from constants import get_rgb32_lut
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 # ==============================================================================
 # MODIFICA 1: Aggiunta degli import necessari e della funzione di supporto
@@ -56,6 +63,13 @@ class ThermalEngine(QObject):
     temperatures_calculated = Signal()
     error_occurred = Signal(str)
     
+    # PIL modes whose decoded buffer QImage can wrap without conversion
+    _PIL_QIMAGE_FORMATS = {
+        "RGB": QImage.Format_RGB888,
+        "RGBA": QImage.Format_RGBA8888,
+        "L": QImage.Format_Grayscale8,
+    }
+
     def __init__(self):
         """Initialize the thermal engine with default values."""
         super().__init__()
@@ -83,39 +97,170 @@ class ThermalEngine(QObject):
             "AtmosphericTransmission": 0.95,
             "RelativeHumidity": 50.0,
         }
+        
+        # Persistent exiftool process (started lazily, see _get_exiftool)
+        self._exiftool = None
+        
+        # Raw value -> temperature lookup table for the loaded image
+        self._temperature_lut = None
+        self._temperature_lut_key = None
+        self._raw_min = 0
+        self._raw_max = 0
+        self._raw_offsets = None
+        # Set once _raw_offsets was handed to a background ROI task (see
+        # get_roi_data_snapshot); the next load must not rewrite it in place
+        self._raw_offsets_shared = False
+        
+        # Tables for per-ROI emissivities, keyed like _temperature_lut_key
+        self._roi_lut_cache = {}
+        
+        # Inputs of the current temperature_data; the version is bumped on
+        # every image load so a new image never matches an old key
+        self._thermal_data_version = 0
+        self._temperature_key = None
+        
+        # Reusable index and RGB output buffers for create_colored_pixmap
+        self._index_buffer = None
+        self._quantized_index_buffer = None
+        self._rgb_buffer = None
+        # Inputs of the current base_pixmap (see create_colored_pixmap)
+        self._pixmap_key = None
+        # Last (key, pixmap) produced by _scaled_export_pixmap
+        self._scaled_export_cache = None
+        
+        # Parameters parsed from the current metadata, and the Planck
+        # constants plus reflected raw value of the last calculation as a
+        # single (key, constants) pair, so ROI workers never see a torn update
+        self._metadata_parameters = None
+        self._planck_cache = None
+
+    def _get_exiftool(self):
+        """
+        Return the persistent exiftool process, starting it on first use.
+        
+        exiftool runs in -stay_open mode, so metadata, raw thermal and
+        embedded image extraction for every opened file share a single
+        process instead of forking a new one per request.
+        
+        Returns:
+            exiftool.ExifTool: The running exiftool instance.
+        """
+        if self._exiftool is None or not self._exiftool.running:
+            self._exiftool = self._start_exiftool()
+        return self._exiftool
+
+    @staticmethod
+    def _start_exiftool():
+        """
+        Start a new exiftool process in -stay_open mode.
+        
+        Returns:
+            exiftool.ExifTool: The running exiftool instance.
+        """
+        # ==============================================================================
+        # MODIFICA 2: Usa resource_path per trovare exiftool
+        # Essendo su macOS, il nome dell'eseguibile è "exiftool".
+        # Il codice è scritto per funzionare anche su Windows ("exiftool.exe").
+        # ==============================================================================
+        exiftool_executable = resource_path("exiftool_bin" if sys.platform != "win32" else "exiftool.exe")
+        # ==============================================================================
+        # Fine Modifica 2
+        # ==============================================================================
+        et = exiftool.ExifTool(executable=exiftool_executable)
+        et.run()
+        return et
+
+    def shutdown_exiftool(self):
+        """Terminate the persistent exiftool process if it is running."""
+        if self._exiftool is not None and self._exiftool.running:
+            try:
+                self._exiftool.terminate()
+            except Exception as e:
+                print(f"Error stopping exiftool: {e}")
+        self._exiftool = None
 
-    def load_thermal_image(self, file_path: str) -> bool:
+    def read_thermal_file(self, file_path: str, et=None) -> tuple:
+        """
+        Run the exiftool requests for a file without touching engine state.
+        
+        Args:
+            file_path (str): Path to the thermal image file.
+            et: exiftool instance to use, defaults to the engine's own process.
+            
+        Returns:
+            tuple: (metadata, raw_thermal_bytes, embedded_image_bytes).
+        """
+        if et is None:
+            et = self._get_exiftool()
+
+        # Extract EXIF metadata using exiftool
+        metadata = json.loads(et.execute("-json", file_path))[0]
+
+        # Extract raw thermal data and the embedded visible image with a
+        # single request; -json -b returns both payloads base64-encoded
+        binary_entry = json.loads(et.execute(
+            "-json", "-b", "-RawThermalImage", "-EmbeddedImage", file_path
+        ))[0]
+        return (
+            metadata,
+            self._binary_tag(binary_entry, "RawThermalImage"),
+            self._binary_tag(binary_entry, "EmbeddedImage"),
+        )
+
+    def iter_thermal_files(self, file_paths):
+        """
+        Yield (path, file_data) pairs, reading the next file in the background.
+        
+        While the caller processes one image, the exiftool requests for the
+        next one run on a worker thread with its own exiftool process, so
+        batch runs overlap extraction with processing. file_data is the
+        read_thermal_file tuple, to be passed to load_thermal_image, or None
+        if the read failed (load_thermal_image then retries and reports).
+        
+        Args:
+            file_paths (list): Paths of the thermal images, in order.
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+
+        et = self._start_exiftool()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = executor.submit(self.read_thermal_file, file_paths[0], et)
+            for i, file_path in enumerate(file_paths):
+                try:
+                    file_data = pending.result()
+                except Exception as e:
+                    print(f"⚠️ Prefetch failed for {file_path}: {e}")
+                    file_data = None
+                if i + 1 < len(file_paths):
+                    pending = executor.submit(self.read_thermal_file, file_paths[i + 1], et)
+                yield file_path, file_data
+        finally:
+            executor.shutdown(wait=True)
+            try:
+                et.terminate()
+            except Exception as e:
+                print(f"Error stopping exiftool: {e}")
+
+    def load_thermal_image(self, file_path: str, file_data: tuple = None) -> bool:
         """
         Load a FLIR thermal image and extract all necessary data.
         
         Args:
             file_path (str): Path to the thermal image file.
+            file_data (tuple): Result of read_thermal_file for this path, if
+                already read (see iter_thermal_files). Defaults to None.
             
         Returns:
             bool: True if loading was successful, False otherwise.
         """
         try:
             self.current_image_path = file_path
-            
-            # ==============================================================================
-            # MODIFICA 2: Usa resource_path per trovare exiftool
-            # Essendo su macOS, il nome dell'eseguibile è "exiftool".
-            # Il codice è scritto per funzionare anche su Windows ("exiftool.exe").
-            # ==============================================================================
-            exiftool_executable = resource_path("exiftool_bin" if sys.platform != "win32" else "exiftool.exe")
-
-            # Extract EXIF metadata using exiftool
-            with exiftool.ExifTool(executable=exiftool_executable) as et:
-                json_string = et.execute(b"-json", file_path.encode())
-                self.metadata = json.loads(json_string)[0]
-                
-            # Extract raw thermal data
-            command = [exiftool_executable, "-b", "-RawThermalImage", file_path]
-            # ==============================================================================
-            # Fine Modifica 2
-            # ==============================================================================
-            result = subprocess.run(command, capture_output=True, check=True)
-            raw_thermal_bytes = result.stdout
+            if file_data is None:
+                file_data = self.read_thermal_file(file_path)
+            self.metadata, raw_thermal_bytes, rgb_bytes = file_data
             
             if not raw_thermal_bytes:
                 raise ValueError("Binary thermal data not extracted.")
@@ -123,11 +268,15 @@ class ThermalEngine(QObject):
             # Process thermal data based on image type
             image_type = self.metadata.get("APP1:RawThermalImageType", "Unknown")
             if image_type == "PNG":
-                # PNG format thermal data
-                self.thermal_data = np.array(Image.open(io.BytesIO(raw_thermal_bytes)))
-                self.thermal_data.byteswap(inplace=True)
+                # PNG format thermal data is stored MSB-first: reinterpret the
+                # decoded pixels with the swapped byte order instead of
+                # swapping them in a separate pass. The only native copy made
+                # is _raw_offsets below, which is what the hot paths read.
+                decoded = np.asarray(Image.open(io.BytesIO(raw_thermal_bytes)))
+                self.thermal_data = decoded.view(decoded.dtype.newbyteorder())
             else:
-                # Raw binary thermal data
+                # Raw binary thermal data, viewed in place without copying
+                # the bytes returned by exiftool (thermal_data is read-only)
                 width = self.metadata.get('APP1:RawThermalImageWidth')
                 height = self.metadata.get('APP1:RawThermalImageHeight')
                 if not width or not height:
@@ -136,8 +285,38 @@ class ThermalEngine(QObject):
                     raw_thermal_bytes, dtype=np.uint16
                 ).reshape((height, width))
 
+            # Raw range bounds the temperature lookup table (see calculate_temperatures)
+            self._temperature_lut = None
+            self._temperature_lut_key = None
+            self._roi_lut_cache = {}
+            self._raw_min = int(self.thermal_data.min())
+            self._raw_max = int(self.thermal_data.max())
+            # Table offsets don't depend on the parameters: compute them once
+            # per image instead of once per recalculation
+            if np.issubdtype(self.thermal_data.dtype, np.integer):
+                # Consecutive images from one camera share a shape, so batch
+                # runs rewrite the previous image's buffer instead of
+                # allocating a new one per file, unless a background ROI
+                # task may still be reading it
+                offsets = self._raw_offsets
+                offsets_dtype = self.thermal_data.dtype.newbyteorder("=")
+                if (offsets is None or self._raw_offsets_shared or
+                        offsets.shape != self.thermal_data.shape or
+                        offsets.dtype != offsets_dtype):
+                    offsets = np.empty(self.thermal_data.shape, dtype=offsets_dtype)
+                self._raw_offsets = np.subtract(
+                    self.thermal_data, self._raw_min, out=offsets, casting="unsafe"
+                )
+            else:
+                self._raw_offsets = None
+            self._raw_offsets_shared = False
+            self._thermal_data_version += 1
+            self._temperature_key = None
+            self._metadata_parameters = None
+            self._planck_cache = None
+
             # Extract visible light image if available
-            self._extract_visible_image(file_path)
+            self._extract_visible_image(rgb_bytes)
             
             self.data_loaded.emit()
             return True
@@ -146,34 +325,57 @@ class ThermalEngine(QObject):
             self.error_occurred.emit(f"Unable to process file: {e}")
             return False
 
-    def _extract_visible_image(self, file_path: str):
+    @staticmethod
+    def _binary_tag(entry: dict, tag: str) -> bytes:
         """
-        Extract visible light image from the thermal file.
+        Return the payload of a binary tag from an exiftool -json -b entry.
         
         Args:
-            file_path (str): Path to the thermal image file.
+            entry (dict): One entry of exiftool's JSON output.
+            tag (str): Tag name without group prefix (e.g. "RawThermalImage").
+            
+        Returns:
+            bytes: The decoded payload, or b"" if the tag is missing.
+        """
+        for key, value in entry.items():
+            if key == tag or key.endswith(":" + tag):
+                value = str(value)
+                # exiftool only base64-encodes data that is not valid UTF-8
+                if value.startswith("base64:"):
+                    return base64.b64decode(value[len("base64:"):])
+                return value.encode("utf-8")
+        return b""
+
+    def _extract_visible_image(self, rgb_bytes: bytes):
+        """
+        Decode the visible light image embedded in the thermal file.
+        
+        Args:
+            rgb_bytes (bytes): EmbeddedImage payload extracted by exiftool.
         """
         try:
-            # ==============================================================================
-            # MODIFICA 3: Usa resource_path anche qui per coerenza
-            # ==============================================================================
-            exiftool_executable = resource_path("exiftool_bin" if sys.platform != "win32" else "exiftool.exe")
-            command_rgb = [exiftool_executable, "-b", "-EmbeddedImage", file_path]
-            # ==============================================================================
-            # Fine Modifica 3
-            # ==============================================================================
-            result_rgb = subprocess.run(command_rgb, capture_output=True, check=True)
-            rgb_bytes = result_rgb.stdout
-            
             if rgb_bytes:
-                # Process visible light image
-                image_rgb = Image.open(io.BytesIO(rgb_bytes))
-                image_rgb = image_rgb.convert("RGB")
+                # Let Qt decode the embedded image straight into its native
+                # pixel format: no PIL buffer, no numpy copy, no RGB888 conversion.
+                # FLIR embeds JPEG; naming the format skips probing every plugin
+                image_format = "JPEG" if rgb_bytes[:2] == b"\xff\xd8" else None
+                qimage = QImage.fromData(rgb_bytes, image_format)
+                
+                if qimage.isNull():
+                    # Formats without a Qt image plugin go through PIL
+                    image_rgb = Image.open(io.BytesIO(rgb_bytes))
+                    # Grayscale and RGBA images map onto a QImage format as
+                    # they are; only other modes pay for an RGB conversion
+                    qt_format = self._PIL_QIMAGE_FORMATS.get(image_rgb.mode)
+                    if qt_format is None:
+                        image_rgb = image_rgb.convert("RGB")
+                        qt_format = QImage.Format_RGB888
+                    
+                    # The array must stay alive until QPixmap.fromImage has copied it
+                    rgb = np.asarray(image_rgb)
+                    height, width = rgb.shape[:2]
+                    qimage = QImage(rgb.data, width, height, rgb.strides[0], qt_format)
                 
-                # Convert to QPixmap for display
-                data = image_rgb.tobytes("raw", "RGB")
-                qimage = QImage(data, image_rgb.width, image_rgb.height, 
-                              image_rgb.width * 3, QImage.Format_RGB888)
                 self.base_pixmap_visible = QPixmap.fromImage(qimage)
             else:
                 self.base_pixmap_visible = None
@@ -182,10 +384,30 @@ class ThermalEngine(QObject):
             print(f"Error loading visible image: {e}")
             self.base_pixmap_visible = None
 
+    def is_calculation_current(self, thermal_parameters: dict) -> bool:
+        """
+        Check whether temperature_data was computed from these parameters.
+        
+        Args:
+            thermal_parameters (dict): Dictionary containing thermal calculation parameters.
+            
+        Returns:
+            bool: True if the loaded image's temperatures are up to date.
+        """
+        return (self.temperature_data is not None and
+                self._temperature_key == self._make_temperature_key(thermal_parameters))
+
+    def _make_temperature_key(self, thermal_parameters: dict) -> tuple:
+        """Build the cache key identifying a temperature calculation."""
+        return (self._thermal_data_version,) + tuple(sorted(thermal_parameters.items()))
+
     def calculate_temperatures(self, thermal_parameters: dict) -> bool:
         """
         Calculate temperature matrix from raw thermal data using Planck equation.
         
+        Returns immediately if the temperatures of the loaded image were
+        already calculated with the same parameters.
+        
         Args:
             thermal_parameters (dict): Dictionary containing thermal calculation parameters.
             
@@ -194,24 +416,44 @@ class ThermalEngine(QObject):
         """
         if self.thermal_data is None:
             return False
+        
+        if self.is_calculation_current(thermal_parameters):
+            return True
             
         try:
             # Extract emissivity
             emissivity = thermal_parameters.get("Emissivity", 0.95)
             
-            # Calculate temperatures using Planck equation
-            temp_celsius = self._calculate_temperatures_from_raw(
-                self.thermal_data, emissivity, thermal_parameters
-            )
-            
-            # Apply environmental corrections
-            self.temperature_data = self._apply_environmental_correction(
-                temp_celsius, thermal_parameters
-            )
+            if np.issubdtype(self.thermal_data.dtype, np.integer):
+                # Integer sensor counts: evaluate the Planck equation once per
+                # distinct raw value, then map every pixel through the table,
+                # gathering into the previous result's array when it fits
+                lut = self._get_temperature_lut(emissivity, thermal_parameters)
+                out = self.temperature_data
+                if (out is None or out.shape != self._raw_offsets.shape or
+                        out.dtype != lut.dtype):
+                    out = np.empty(self._raw_offsets.shape, dtype=lut.dtype)
+                # The old contents are about to be overwritten
+                self._temperature_key = None
+                self.temperature_data = np.take(lut, self._raw_offsets, out=out)
+            else:
+                # Calculate corrected temperatures using Planck equation,
+                # directly in the float32 precision they are stored in and
+                # into the previous result's array when it fits
+                out = self.temperature_data
+                if (out is None or out.shape != self.thermal_data.shape or
+                        out.dtype != np.float32):
+                    out = None
+                self._temperature_key = None
+                self.temperature_data = self._calculate_temperatures_from_raw(
+                    self.thermal_data, emissivity, thermal_parameters,
+                    dtype=np.float32, out=out
+                )
             
             # Calculate temperature range
             self._update_temperature_range()
             
+            self._temperature_key = self._make_temperature_key(thermal_parameters)
             self.temperatures_calculated.emit()
             return True
             
@@ -219,75 +461,201 @@ class ThermalEngine(QObject):
             self.error_occurred.emit(f"Error calculating temperatures: {e}")
             return False
 
+    def _get_temperature_lut(self, emissivity: float, parameters: dict) -> np.ndarray:
+        """
+        Get the raw value -> corrected temperature table for the current image.
+        
+        The table covers the raw range of the loaded image (at most 65536
+        entries for 16-bit data) and is rebuilt only when the parameters
+        change, so recalculations with unchanged parameters cost a single
+        gather instead of an exp/log per pixel.
+        
+        Args:
+            emissivity (float): Emissivity value for the calculation.
+            parameters (dict): Thermal calculation parameters.
+            
+        Returns:
+            np.ndarray: Temperatures in Celsius indexed by raw value - raw minimum.
+        """
+        # The table spans the image's raw range, so it belongs to that image
+        key = (self._thermal_data_version, emissivity) + tuple(sorted(parameters.items()))
+        if self._temperature_lut is None or self._temperature_lut_key != key:
+            self._temperature_lut = self._build_temperature_lut(
+                emissivity, parameters, self._raw_min, self._raw_max
+            )
+            self._temperature_lut_key = key
+        return self._temperature_lut
+
+    def _get_roi_temperature_lut(self, emissivity: float, parameters: dict,
+                                 snapshot: dict) -> np.ndarray:
+        """
+        Get the temperature table for an ROI-specific emissivity.
+        
+        ROIs keep their own emissivity, so their tables are cached separately
+        from the full-frame one; a handful of distinct emissivities per image
+        is typical, and the cache is simply dropped if it grows past that.
+        Tables are keyed by image version, so one built by a background task
+        for a since-replaced image is never returned for the new one.
+        
+        Args:
+            emissivity (float): ROI emissivity.
+            parameters (dict): Thermal calculation parameters.
+            snapshot (dict): Image state from get_roi_data_snapshot.
+            
+        Returns:
+            np.ndarray: Temperatures in Celsius indexed by raw value - raw minimum.
+        """
+        key = (snapshot["version"], emissivity) + tuple(sorted(parameters.items()))
+        cache = self._roi_lut_cache
+        lut = cache.get(key)
+        if lut is None:
+            if len(cache) >= 32:
+                cache.clear()
+            lut = self._build_temperature_lut(
+                emissivity, parameters, snapshot["raw_min"], snapshot["raw_max"]
+            )
+            cache[key] = lut
+        return lut
+
+    def _build_temperature_lut(self, emissivity: float, parameters: dict,
+                               raw_min: int, raw_max: int) -> np.ndarray:
+        """Evaluate the Planck equation once for every raw value in [raw_min, raw_max]."""
+        raw_values = np.arange(raw_min, raw_max + 1, dtype=np.float64)
+        # Planck math in float64; the stored temperatures only need
+        # float32 (~1e-5 °C resolution, far below sensor noise)
+        return self._calculate_temperatures_from_raw(
+            raw_values, emissivity, parameters
+        ).astype(np.float32)
+
     def _calculate_temperatures_from_raw(self, raw_data: np.ndarray, 
                                        emissivity: float, 
-                                       parameters: dict) -> np.ndarray:
+                                       parameters: dict,
+                                       dtype=np.float64,
+                                       out: np.ndarray = None) -> np.ndarray:
         """
         Core Planck equation implementation for temperature calculation.
         
+        The environmental correction is a constant offset, so it is folded
+        into the Kelvin to Celsius conversion instead of a separate pass.
+        
         Args:
             raw_data (np.ndarray): Raw thermal data from sensor.
             emissivity (float): Emissivity value for the calculation.
             parameters (dict): Thermal calculation parameters.
+            dtype: Working and result precision, float64 by default. Per-pixel
+                   results only need float32, which halves memory traffic.
+            out (np.ndarray, optional): Array of raw_data's shape and dtype
+                                        to compute into instead of a new one.
             
         Returns:
-            np.ndarray: Calculated temperatures in Celsius.
+            np.ndarray: Calculated, environmentally corrected temperatures in Celsius.
         """
         try:
-            # Extract Planck parameters
-            refl_temp_C = parameters.get("ReflectedApparentTemperature", 20.0)
-            R1 = parameters.get("PlanckR1")
-            R2 = parameters.get("PlanckR2") 
-            B = parameters.get("PlanckB")
-            F = parameters.get("PlanckF")
-            O = parameters.get("PlanckO")
-            
-            # Validate Planck parameters
-            if any(param is None for param in [R1, R2, B, F, O]):
-                # Extract from metadata if not provided
-                R1 = float(self.metadata.get("APP1:PlanckR1", R1 or 0))
-                R2 = float(self.metadata.get("APP1:PlanckR2", R2 or 0))
-                B = float(self.metadata.get("APP1:PlanckB", B or 0))
-                F = float(self.metadata.get("APP1:PlanckF", F or 0))
-                O = float(self.metadata.get("APP1:PlanckO", O or 0))
-            
-            refl_temp_K = refl_temp_C + 273.15
-            
-            # Calculate reflected temperature component
-            raw_refl = R1 / (R2 * (np.exp(B / refl_temp_K) - F)) - O
-            
-            # Apply emissivity correction
-            raw_obj = (raw_data - (1 - emissivity) * raw_refl) / max(emissivity, 1e-6)
-            
-            # Apply Planck equation
-            log_arg = R1 / (R2 * (raw_obj + O)) + F
-            temp_K = np.full(log_arg.shape, np.nan, dtype=np.float64)
-            valid_indices = log_arg > 0
-            temp_K[valid_indices] = B / np.log(log_arg[valid_indices])
-            
-            # Convert to Celsius
-            return temp_K - 273.15
+            R1, R2, B, F, O, raw_refl = self._get_planck_constants(parameters)
+            
+            # Kelvin -> corrected Celsius in a single subtraction
+            celsius_offset = 273.15 - self._get_environmental_correction(parameters)
+            
+            if NUMEXPR_AVAILABLE:
+                # Fused, multi-threaded evaluation without the intermediate
+                # arrays; operands are cast to dtype so the expression (and
+                # its output) stays in that precision
+                cast = np.dtype(dtype).type
+                return ne.evaluate(
+                    "where(R1 / (R2 * ((raw - k_refl) * inv_e + O)) + F > 0, "
+                    "B / log(R1 / (R2 * ((raw - k_refl) * inv_e + O)) + F), nan) - celsius_offset",
+                    local_dict={
+                        "raw": raw_data.astype(dtype, copy=False),
+                        "k_refl": cast((1 - emissivity) * raw_refl),
+                        "inv_e": cast(1.0 / max(emissivity, 1e-6)),
+                        "R1": cast(R1), "R2": cast(R2), "B": cast(B), "F": cast(F), "O": cast(O),
+                        "nan": cast(np.nan),
+                        "celsius_offset": cast(celsius_offset),
+                    },
+                    out=out if out is not None else np.empty(raw_data.shape, dtype=dtype),
+                )
+            
+            # Apply emissivity correction, then the Planck equation, in place
+            # in a single working array instead of one temporary per operation
+            log_arg = np.subtract(raw_data, (1 - emissivity) * raw_refl, out=out, dtype=dtype)
+            log_arg *= 1.0 / max(emissivity, 1e-6)
+            log_arg += O
+            log_arg *= R2
+            np.divide(R1, log_arg, out=log_arg)
+            log_arg += F
+            
+            # Dense log over the whole array, then blank the invalid pixels,
+            # instead of gathering and scattering the valid subset. Usually
+            # every pixel is valid: a single min() reduction establishes that
+            # and skips building and applying the mask
+            invalid = None if log_arg.min() > 0 else log_arg <= 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                temp_K = np.log(log_arg, out=log_arg)
+                np.divide(B, temp_K, out=temp_K)
+            if invalid is not None:
+                np.copyto(temp_K, np.nan, where=invalid)
+            
+            # Convert to corrected Celsius
+            temp_K -= celsius_offset
+            return temp_K
             
         except Exception as e:
             print(f"Error in Planck calculation: {e}")
-            return np.full(raw_data.shape, np.nan, dtype=np.float64)
+            return np.full(raw_data.shape, np.nan, dtype=dtype)
 
-    def _apply_environmental_correction(self, temp_data: np.ndarray, 
-                                      parameters: dict) -> np.ndarray:
+    def _get_planck_constants(self, parameters: dict) -> tuple:
         """
-        Apply environmental corrections to improve temperature accuracy.
+        Resolve the Planck constants and the reflected raw value.
+        
+        The result only depends on the Planck constants and the reflected
+        temperature, so it is kept until those change instead of being
+        re-parsed from the metadata for every ROI.
+        
+        Args:
+            parameters (dict): Thermal calculation parameters.
+            
+        Returns:
+            tuple: (R1, R2, B, F, O, raw_refl).
+        """
+        refl_temp_C = parameters.get("ReflectedApparentTemperature", 20.0)
+        planck = tuple(parameters.get(name) for name in
+                       ("PlanckR1", "PlanckR2", "PlanckB", "PlanckF", "PlanckO"))
+        key = (refl_temp_C,) + planck
+        cached = self._planck_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        R1, R2, B, F, O = planck
+        
+        # Validate Planck parameters
+        if any(param is None for param in planck):
+            # Extract from metadata if not provided
+            R1 = float(self.metadata.get("APP1:PlanckR1", R1 or 0))
+            R2 = float(self.metadata.get("APP1:PlanckR2", R2 or 0))
+            B = float(self.metadata.get("APP1:PlanckB", B or 0))
+            F = float(self.metadata.get("APP1:PlanckF", F or 0))
+            O = float(self.metadata.get("APP1:PlanckO", O or 0))
+        
+        refl_temp_K = refl_temp_C + 273.15
+        
+        # Calculate reflected temperature component
+        raw_refl = R1 / (R2 * (np.exp(B / refl_temp_K) - F)) - O
+        
+        constants = (R1, R2, B, F, O, float(raw_refl))
+        self._planck_cache = (key, constants)
+        return constants
+
+    def _get_environmental_correction(self, parameters: dict) -> float:
+        """
+        Compute the environmental temperature correction.
         
         Args:
-            temp_data (np.ndarray): Raw temperature data in Celsius.
             parameters (dict): Environmental parameters.
             
         Returns:
-            np.ndarray: Environmentally corrected temperature data.
+            float: Correction in degrees Celsius to add to the temperatures.
         """
         try:
-            if temp_data is None or np.all(np.isnan(temp_data)):
-                return temp_data
-                
             # Extract environmental parameters
             atmospheric_temp = parameters.get("AtmosphericTemperature", 20.0)
             atmospheric_transmission = parameters.get("AtmosphericTransmission", 0.95)
@@ -298,16 +666,25 @@ class ThermalEngine(QObject):
             transmission_correction = (1.0 - atmospheric_transmission) * 0.002
             humidity_correction = (relative_humidity - 50.0) * 0.00002
             
-            total_correction = temp_correction + transmission_correction + humidity_correction
-            return temp_data + total_correction
+            return float(temp_correction + transmission_correction + humidity_correction)
             
         except Exception as e:
             print(f"Warning: Environmental correction not applied - {e}")
-            return temp_data
+            return 0.0
 
     def _update_temperature_range(self):
         """Update the temperature range from current temperature data."""
         if self.temperature_data is not None:
+            # NaN-skipping reductions straight over the frame; only if the
+            # result is not finite (all NaN, or an infinity) fall back to
+            # filtering a copy
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                temp_min = np.nanmin(self.temperature_data)
+                temp_max = np.nanmax(self.temperature_data)
+            if np.isfinite(temp_min) and np.isfinite(temp_max):
+                self.temp_min, self.temp_max = float(temp_min), float(temp_max)
+                return
             finite_data = self.temperature_data[np.isfinite(self.temperature_data)]
             if len(finite_data) > 0:
                 self.temp_min = float(np.min(finite_data))
@@ -331,31 +708,171 @@ class ThermalEngine(QObject):
         """
         if self.temperature_data is None:
             return QPixmap()
+        
+        # Redraws and exports with unchanged temperatures, palette and range
+        # reuse the last pixmap instead of re-running the colormap
+        pixmap_key = None
+        if self._temperature_key is not None:
+            pixmap_key = (self._temperature_key, palette_name, bool(inverted),
+                          self.temp_min, self.temp_max)
+            if pixmap_key == self._pixmap_key and self.base_pixmap is not None:
+                return self.base_pixmap
+            
+        # Palette as packed 32-bit pixels (cached per palette/inversion)
+        lut = self._get_palette_lut(palette_name, inverted)
+        n_colors = lut.shape[0]
+        
+        # Quantize to the narrowest index type the palette allows: one byte
+        # per pixel for 256-entry colormaps instead of an 8-byte intp array
+        index_dtype = np.uint8 if n_colors <= 256 else np.uint16
+        
+        height, width = self.temperature_data.shape
+        image_32bit = self._get_rgb_buffer(height, width)
+        
+        # Integer data: temperature_data is the temperature table gathered by
+        # raw offset, so color the table (one entry per distinct raw value)
+        # and gather pixels straight from the raw offsets, instead of scaling
+        # every float temperature
+        from_table = self._raw_offsets is not None and self._temperature_key is not None
+        source = self._temperature_lut if from_table else self.temperature_data
+        
+        indices = self._scale_to_palette_indices(
+            source, n_colors, self._get_index_buffer(source.shape)
+        )
+        # Truncate into the persistent 1-2 byte index buffer instead of a
+        # new astype() array per redraw
+        quantized = self._get_quantized_index_buffer(indices.shape, index_dtype)
+        np.copyto(quantized, indices, casting="unsafe")
+        
+        # Gather colors into the reusable pixel buffer (mode="clip" avoids the
+        # internal copy np.take makes for bounds checking when out= is given)
+        if from_table:
+            color_table = np.take(lut, quantized, mode="clip")
+            np.take(color_table, self._raw_offsets, out=image_32bit, mode="clip")
+        else:
+            np.take(lut, quantized, out=image_32bit, mode="clip")
+        
+        # Format_RGB32 is the raster pixmap format, so fromImage is a plain
+        # copy instead of a per-pixel RGB888 -> RGB32 conversion
+        q_image = QImage(image_32bit.data, width, height, width * 4, QImage.Format_RGB32)
+        self.base_pixmap = QPixmap.fromImage(q_image)
+        self._pixmap_key = pixmap_key
+        
+        return self.base_pixmap
+
+    def _scale_to_palette_indices(self, temperatures: np.ndarray, n_colors: int,
+                                  out: np.ndarray) -> np.ndarray:
+        """
+        Scale temperatures to (fractional) palette indices over the display range.
+        
+        Args:
+            temperatures (np.ndarray): Temperatures in Celsius.
+            n_colors (int): Number of palette entries.
+            out (np.ndarray): float32 output buffer of the same shape.
             
-        # Normalize temperature data to 0-1 range
+        Returns:
+            np.ndarray: out, holding indices clipped to [0, n_colors - 1].
+        """
         temp_range = self.temp_max - self.temp_min
         if temp_range == 0:
             temp_range = 1
         
-        norm_data = (self.temperature_data - self.temp_min) / temp_range
-        norm_data = np.nan_to_num(norm_data)
+        np.subtract(temperatures, self.temp_min, out=out)
+        out *= n_colors / temp_range
+        np.nan_to_num(out, copy=False, nan=0.0)
+        np.clip(out, 0, n_colors - 1, out=out)
+        return out
+
+    def _scaled_export_pixmap(self, pixmap: QPixmap, width: int, height: int) -> QPixmap:
+        """
+        Smoothly scale a pixmap for export, reusing the last result.
+        
+        The plain and ROI thermal exports of one image scale the same cached
+        base pixmap to the same size, so the second export reuses the first
+        resample. Callers that paint on the result must paint on a copy.
         
-        # Apply color mapping
-        cmap = PALETTE_MAP.get(palette_name, cm.inferno)
-        if inverted:
-            norm_data = 1.0 - norm_data
+        Args:
+            pixmap (QPixmap): Pixmap to scale.
+            width (int): Target width in pixels.
+            height (int): Target height in pixels.
             
-        colored_data = cmap(norm_data)
+        Returns:
+            QPixmap: The scaled pixmap (aspect ratio kept).
+        """
+        key = (pixmap.cacheKey(), width, height)
+        cached = self._scaled_export_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         
-        # Convert to 8-bit RGB
-        image_8bit = (colored_data[:, :, :3] * 255).astype(np.uint8)
+        scaled = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._scaled_export_cache = (key, scaled)
+        return scaled
+
+    def _get_palette_lut(self, palette_name: str, inverted: bool) -> np.ndarray:
+        """
+        Get a palette as a lookup table of packed 0xffRRGGBB pixels.
         
-        # Create QPixmap
-        height, width, _ = image_8bit.shape
-        q_image = QImage(image_8bit.data, width, height, width * 3, QImage.Format_RGB888)
-        self.base_pixmap = QPixmap.fromImage(q_image)
+        Integer indices address the colormap's own color table directly, so
+        the result matches calling the colormap on normalized data.
         
-        return self.base_pixmap
+        Args:
+            palette_name (str): Name of the color palette.
+            inverted (bool): Whether to reverse the palette.
+            
+        Returns:
+            np.ndarray: (N,) uint32 array of colors.
+        """
+        return get_rgb32_lut(palette_name, bool(inverted))
+
+    def _get_index_buffer(self, shape: tuple) -> np.ndarray:
+        """
+        Get the persistent float buffer for palette indices, reallocating only
+        on size change.
+        
+        Args:
+            shape (tuple): Shape of the temperature data.
+            
+        Returns:
+            np.ndarray: float32 buffer of the given shape.
+        """
+        if self._index_buffer is None or self._index_buffer.shape != shape:
+            self._index_buffer = np.empty(shape, dtype=np.float32)
+        return self._index_buffer
+
+    def _get_quantized_index_buffer(self, shape: tuple, dtype) -> np.ndarray:
+        """
+        Get the persistent integer palette index buffer, reallocating only on
+        size or type change.
+        
+        Args:
+            shape (tuple): Shape of the temperature data.
+            dtype: np.uint8, or np.uint16 for palettes over 256 colors.
+            
+        Returns:
+            np.ndarray: Integer buffer of the given shape and dtype.
+        """
+        buffer = self._quantized_index_buffer
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._quantized_index_buffer = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def _get_rgb_buffer(self, height: int, width: int) -> np.ndarray:
+        """
+        Get the persistent RGB32 output buffer, reallocating only on size change.
+        
+        QPixmap.fromImage copies the pixels, so the buffer can be reused as
+        soon as the pixmap has been created.
+        
+        Args:
+            height (int): Image height in pixels.
+            width (int): Image width in pixels.
+            
+        Returns:
+            np.ndarray: (height, width) uint32 buffer of 0xffRRGGBB pixels.
+        """
+        if self._rgb_buffer is None or self._rgb_buffer.shape != (height, width):
+            self._rgb_buffer = np.empty((height, width), dtype=np.uint32)
+        return self._rgb_buffer
 
     def get_temperature_at_point(self, x: int, y: int) -> float:
         """
@@ -374,7 +891,9 @@ class ThermalEngine(QObject):
             x >= self.temperature_data.shape[1]):
             return float('nan')
         
-        return self.temperature_data[y, x]
+        # item() reads the element straight into a Python float instead of
+        # boxing a NumPy scalar the caller then compares and formats
+        return self.temperature_data.item(y, x)
 
     def get_thermal_parameters_from_metadata(self) -> dict:
         """
@@ -385,6 +904,10 @@ class ThermalEngine(QObject):
         """
         if not self.metadata:
             return self.default_parameters.copy()
+        
+        # Metadata doesn't change until the next load; parse it once
+        if self._metadata_parameters is not None:
+            return self._metadata_parameters.copy()
             
         parameters = {}
         
@@ -411,8 +934,9 @@ class ThermalEngine(QObject):
                     parameters[param] = None
             else:
                 parameters[param] = None
-                
-        return parameters
+        
+        self._metadata_parameters = parameters
+        return parameters.copy()
 
     def get_overlay_parameters_from_metadata(self) -> dict:
         """
@@ -445,40 +969,137 @@ class ThermalEngine(QObject):
             "offset_y": offset_y
         }
 
-    def compute_roi_temperatures(self, roi_mask: np.ndarray, 
-                               roi_emissivity: float = None) -> np.ndarray:
+    def get_roi_data_snapshot(self, detach: bool = False) -> dict:
+        """
+        Capture the per-image state read by the ROI temperature computations.
+        
+        Background ROI statistics work from a snapshot, so loading another
+        image on the GUI thread never changes the raw range, offsets or
+        parameters under them.
+        
+        Args:
+            detach (bool): True if the snapshot is read off the GUI thread;
+                           the next image load then gives the raw offsets a
+                           new array instead of rewriting these in place.
+            
+        Returns:
+            dict or None: version, thermal_data, raw_offsets, raw_min, raw_max
+                          and parameters, or None without thermal data.
+        """
+        if self.thermal_data is None:
+            return None
+        if detach and self._raw_offsets is not None:
+            self._raw_offsets_shared = True
+        return {
+            "version": self._thermal_data_version,
+            "thermal_data": self.thermal_data,
+            "raw_offsets": self._raw_offsets,
+            "raw_min": self._raw_min,
+            "raw_max": self._raw_max,
+            "parameters": self.get_thermal_parameters_from_metadata(),
+        }
+
+    def compute_roi_temperatures(self, roi_pixels: np.ndarray, 
+                               roi_emissivity: float = None,
+                               snapshot: dict = None) -> np.ndarray:
         """
-        Compute temperature values for pixels within an ROI mask.
+        Compute temperature values for the pixels of an ROI.
         
         Args:
-            roi_mask (np.ndarray): Boolean mask indicating ROI pixels.
+            roi_pixels (np.ndarray): Boolean mask indicating ROI pixels, or
+                                     the flat indices of those pixels.
             roi_emissivity (float, optional): ROI-specific emissivity. 
                                             If None, uses existing temperature data.
+            snapshot (dict, optional): Image state from get_roi_data_snapshot
+                                       to compute from; defaults to the
+                                       current image.
             
         Returns:
             np.ndarray: Temperature values for ROI pixels.
         """
-        if self.thermal_data is None:
-            return np.array([])
-            
-        if roi_emissivity is not None:
-            # Recalculate temperatures with ROI-specific emissivity
-            thermal_roi = self.thermal_data[roi_mask].astype(np.float64)
-            
-            # Get current thermal parameters but override emissivity
-            params = self.get_thermal_parameters_from_metadata()
-            params["Emissivity"] = roi_emissivity
-            
-            # Calculate temperatures for ROI pixels only
-            temp_celsius = self._calculate_temperatures_from_raw(
-                thermal_roi, roi_emissivity, params
-            )
-            return self._apply_environmental_correction(temp_celsius, params)
-        else:
+        if roi_emissivity is None:
             # Use existing temperature data
             if self.temperature_data is None:
                 return np.array([])
-            return self.temperature_data[roi_mask]
+            return self._select_pixels(self.temperature_data, roi_pixels)
+        
+        if snapshot is None:
+            snapshot = self.get_roi_data_snapshot()
+            if snapshot is None:
+                return np.array([])
+            
+        # Current thermal parameters with the emissivity overridden
+        params = dict(snapshot["parameters"])
+        params["Emissivity"] = roi_emissivity
+        
+        # Once the ROI covers more pixels than the image has distinct raw
+        # values, a table lookup is cheaper than per-pixel Planck math
+        if self._use_roi_table(roi_pixels, snapshot):
+            lut = self._get_roi_temperature_lut(roi_emissivity, params, snapshot)
+            return lut[self._select_pixels(snapshot["raw_offsets"], roi_pixels)]
+        
+        # Recalculate temperatures with ROI-specific emissivity; the
+        # Planck kernel converts in its first in-place step, so the
+        # gathered raw counts need no converted copy of their own
+        thermal_roi = self._select_pixels(snapshot["thermal_data"], roi_pixels)
+        
+        # Calculate temperatures for ROI pixels only, in float32 like the
+        # full-frame data (statistics accumulate in float64 regardless)
+        return self._calculate_temperatures_from_raw(
+            thermal_roi, roi_emissivity, params, dtype=np.float32
+        )
+
+    def compute_roi_temperature_histogram(self, roi_pixels: np.ndarray,
+                                          roi_emissivity: float,
+                                          snapshot: dict = None):
+        """
+        Summarize the temperatures of an ROI as counts per distinct raw value.
+        
+        For ROIs large enough to use a temperature table, the pixels are
+        reduced to a histogram over raw values with a single bincount, so
+        statistics can be computed from (temperature, count) pairs without
+        materializing a temperature per pixel.
+        
+        Args:
+            roi_pixels (np.ndarray): Boolean mask or flat indices of the ROI pixels.
+            roi_emissivity (float): ROI-specific emissivity.
+            snapshot (dict, optional): Image state from get_roi_data_snapshot
+                                       to compute from; defaults to the
+                                       current image.
+            
+        Returns:
+            tuple or None: (temperatures, counts) arrays of equal length, or
+                           None when the ROI should be computed per pixel.
+        """
+        if snapshot is None:
+            snapshot = self.get_roi_data_snapshot()
+        if snapshot is None or not self._use_roi_table(roi_pixels, snapshot):
+            return None
+        
+        params = dict(snapshot["parameters"])
+        params["Emissivity"] = roi_emissivity
+        lut = self._get_roi_temperature_lut(roi_emissivity, params, snapshot)
+        counts = np.bincount(self._select_pixels(snapshot["raw_offsets"], roi_pixels),
+                             minlength=lut.size)
+        return lut, counts
+
+    @staticmethod
+    def _use_roi_table(roi_pixels: np.ndarray, snapshot: dict) -> bool:
+        """Whether an ROI has more pixels than the image has distinct raw values."""
+        if snapshot["raw_offsets"] is None:
+            return False
+        if roi_pixels.dtype == bool:
+            pixel_count = np.count_nonzero(roi_pixels)
+        else:
+            pixel_count = roi_pixels.size
+        return pixel_count > snapshot["raw_max"] - snapshot["raw_min"]
+
+    @staticmethod
+    def _select_pixels(data: np.ndarray, roi_pixels: np.ndarray) -> np.ndarray:
+        """Gather ROI pixels by boolean mask or by flat pixel indices."""
+        if roi_pixels.dtype == bool:
+            return data[roi_pixels]
+        return data.reshape(-1).take(roi_pixels)
 
     def reset_data(self):
         """Reset all thermal data and clear the engine state."""
@@ -490,6 +1111,19 @@ class ThermalEngine(QObject):
         self.temp_min = 0.0
         self.temp_max = 100.0
         self.current_image_path = None
+        self._temperature_lut = None
+        self._temperature_lut_key = None
+        self._roi_lut_cache = {}
+        self._raw_offsets = None
+        self._raw_offsets_shared = False
+        self._temperature_key = None
+        self._index_buffer = None
+        self._quantized_index_buffer = None
+        self._rgb_buffer = None
+        self._pixmap_key = None
+        self._scaled_export_cache = None
+        self._metadata_parameters = None
+        self._planck_cache = None
 
     def _create_legend_pixmap(self, palette_name: str, inverted: bool, 
                             target_height: int, scale_factor: float = 1.0,
@@ -743,9 +1377,7 @@ class ThermalEngine(QObject):
                 print(f"🔍 Scaling thermal image from {original_size.width()}x{original_size.height()} to {scaled_width}x{scaled_height} (scale: {scale_factor}x)")
                 
                 # Scale the pixmap using smooth transformation
-                pixmap = pixmap.scaled(scaled_width, scaled_height, 
-                                     Qt.KeepAspectRatio, 
-                                     Qt.SmoothTransformation)
+                pixmap = self._scaled_export_pixmap(pixmap, scaled_width, scaled_height)
             
             # Add legend if requested
             if include_legend:
@@ -871,9 +1503,7 @@ class ThermalEngine(QObject):
                 print(f"🔍 Scaling thermal image from {original_size.width()}x{original_size.height()} to {scaled_width}x{scaled_height} (scale: {scale_factor}x)")
                 
                 # Scale the pixmap using smooth transformation
-                thermal_pixmap = thermal_pixmap.scaled(scaled_width, scaled_height, 
-                                                     Qt.KeepAspectRatio, 
-                                                     Qt.SmoothTransformation)
+                thermal_pixmap = self._scaled_export_pixmap(thermal_pixmap, scaled_width, scaled_height)
                 
                 print(f"🎨 Scaled thermal pixmap: {thermal_pixmap.width()}x{thermal_pixmap.height()}")
             
@@ -887,7 +1517,9 @@ class ThermalEngine(QObject):
             
             print(f"📊 Drawing {len(roi_items)} ROIs on thermal image")
             
-            # Create a painter to draw ROIs on top
+            # Create a painter to draw ROIs on top of a copy: both the base and
+            # the scaled pixmap are cached (the copy detaches on paint)
+            thermal_pixmap = QPixmap(thermal_pixmap)
             painter = QPainter(thermal_pixmap)
             painter.setRenderHint(QPainter.Antialiasing)
             
@@ -9,32 +9,34 @@ FLIR thermal images with advanced ROI (Region of Interest) capabilities.
 import os
 
 import json
-import numpy as np
+import logging
 
 
 # Third-party imports
 
-import matplotlib.cm as cm
-
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout,
     QLineEdit, QPushButton, QLabel, QTextEdit, QTabWidget,
-    QGroupBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QGroupBox, QTableView, QAbstractItemView, QHeaderView,
     QCheckBox, QFileDialog, QMessageBox, QSlider, QSpinBox,
     QDoubleSpinBox, QComboBox, QApplication, QToolBar, QListWidget,
     QProgressBar, QListWidgetItem, QScrollArea, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, QPointF, QRectF, QSignalBlocker
+from PySide6.QtCore import Qt, QPointF, QRectF, QSignalBlocker, QTimer
 from PySide6.QtGui import QPixmap, QPainter, QAction, QKeySequence
 
 from ui.widgets.image_graphics_view import ImageGraphicsView
 from ui.widgets.color_bar_legend import ColorBarLegend
+from ui.widgets.roi_table_model import RoiTableModel
 from constants import *
 
 from core.thermal_engine import ThermalEngine
 from core.roi_controller import ROIController
 from core.settings_manager import SettingsManager
 
+# Diagnostics for per-frame paths; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
 
 class ThermalAnalyzerNG(QMainWindow):
     """
@@ -45,6 +47,24 @@ class ThermalAnalyzerNG(QMainWindow):
     ROIController, SettingsManager).
     """
     
+    # Overlay blend mode names mapped to Qt composition modes, built once
+    # instead of on every overlay redraw (see get_qt_composition_mode)
+    BLEND_MODES = {
+        "Normal": QPainter.CompositionMode_SourceOver,
+        "Multiply": QPainter.CompositionMode_Multiply,
+        "Screen": QPainter.CompositionMode_Screen,
+        "Overlay": QPainter.CompositionMode_Overlay,
+        "Darken": QPainter.CompositionMode_Darken,
+        "Lighten": QPainter.CompositionMode_Lighten,
+        "ColorDodge": QPainter.CompositionMode_ColorDodge,
+        "ColorBurn": QPainter.CompositionMode_ColorBurn,
+        "HardLight": QPainter.CompositionMode_HardLight,
+        "SoftLight": QPainter.CompositionMode_SoftLight,
+        "Difference": QPainter.CompositionMode_Difference,
+        "Exclusion": QPainter.CompositionMode_Exclusion,
+        "Additive": QPainter.CompositionMode_Plus,
+    }
+    
     def __init__(self, parent=None):
         """Initialize the main window and setup the user interface."""
         super().__init__(parent)
@@ -84,7 +104,45 @@ class ThermalAnalyzerNG(QMainWindow):
         # UI state variables
         self.roi_items = {}
         self.current_drawing_tool = None
-        self._updating_roi_table = False
+        
+        # Coalesces overlay slider/spin changes to one recomposite per frame (~60 Hz)
+        self._overlay_timer = QTimer(self)
+        self._overlay_timer.setSingleShot(True)
+        self._overlay_timer.setInterval(16)
+        self._overlay_timer.timeout.connect(self._apply_overlay_changes)
+        self._overlay_settings_dirty = False
+        
+        # Coalesces thermal mouse moves to one tooltip update per frame
+        self._tooltip_timer = QTimer(self)
+        self._tooltip_timer.setSingleShot(True)
+        self._tooltip_timer.setInterval(16)
+        self._tooltip_timer.timeout.connect(self._update_temperature_tooltip)
+        self._tooltip_point = None
+        # Image pixel the tooltip text was last read from
+        self._tooltip_pixel = None
+        
+        # Refits the secondary view once a window resize drag settles
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        # (pixmap cacheKey, viewport size) last fitted in the secondary view
+        self._secondary_display_key = None
+        
+        # Collapses bursts of control changes (slider drags, spin ticks,
+        # ROI drags) into a single settings write once they settle
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.auto_save_settings)
+        
+        # Parsed thermal parameter values, rebuilt after any parameter edit
+        self._thermal_params_cache = None
+        
+        # GPU-accelerated image views are opt-in with --gl: without the
+        # advanced blend equation extension (e.g. on macOS) Qt's GL engine
+        # draws most overlay blend modes as plain SourceOver
+        self._use_opengl = "--gl" in QApplication.arguments()
         
         # Temperature range (for UI display)
         self.temp_min = 0.0
@@ -140,6 +198,9 @@ class ThermalAnalyzerNG(QMainWindow):
         )
         if not file_path: 
             return
+        
+        # Pending changes belong to the image being closed
+        self.flush_auto_save()
             
         # Reset application state
         self.reset_application_state()
@@ -174,6 +235,9 @@ class ThermalAnalyzerNG(QMainWindow):
         """Handle temperatures calculated event."""
         print("Temperatures calculated successfully")
         
+        # The tooltip reading is stale even if the cursor stays on its pixel
+        self._tooltip_pixel = None
+        
         # Apply range mode settings
         if getattr(self, 'range_mode', 'autorange') == "autorange":
             # Update temperature range from data
@@ -234,23 +298,39 @@ class ThermalAnalyzerNG(QMainWindow):
                     line_edit.setToolTip("Parameter not available in EXIF metadata")
 
     def get_current_thermal_parameters(self) -> dict:
-        """Get current thermal parameters from UI inputs."""
-        parameters = {}
+        """Get current thermal parameters from UI inputs.
         
-        for key, line_edit in self.param_inputs.items():
-            text = line_edit.text().strip()
-            if text and text != "N/A":
-                try:
-                    parameters[key] = float(text)
-                except ValueError:
-                    pass  # Skip invalid values
+        The parsed values are cached until a parameter field changes, so
+        per-event callers such as the temperature tooltip don't re-parse
+        every line edit.
+        """
+        if self._thermal_params_cache is None:
+            parameters = {}
+            
+            for key, line_edit in self.param_inputs.items():
+                text = line_edit.text().strip()
+                if text and text != "N/A":
+                    try:
+                        parameters[key] = float(text)
+                    except ValueError:
+                        pass  # Skip invalid values
+            
+            self._thermal_params_cache = parameters
                     
-        return parameters
+        return dict(self._thermal_params_cache)
+
+    def _invalidate_thermal_parameters(self):
+        """Drop the cached parameter values after a parameter field changed."""
+        self._thermal_params_cache = None
 
     def recalculate_and_update_view(self):
         """Recalculate temperatures and update the complete view."""
         thermal_params = self.get_current_thermal_parameters()
         
+        # editingFinished also fires on focus changes without an edit
+        if self.thermal_engine.is_calculation_current(thermal_params):
+            return
+        
         if self.thermal_engine.calculate_temperatures(thermal_params):
             # Update ROI analysis with new temperatures
             self.roi_controller.update_all_analyses()
@@ -315,7 +395,7 @@ class ThermalAnalyzerNG(QMainWindow):
         """Handle ROI added event from controller."""
         from ui.roi_items import RectROIItem, SpotROIItem, PolygonROIItem
         
-        print(f"ROI added: {roi_model.name}")
+        log.debug("ROI added: %s", roi_model.name)
         
         # Create appropriate visual item
         roi_item = None
@@ -337,11 +417,22 @@ class ThermalAnalyzerNG(QMainWindow):
             # Update table
             self.update_roi_table()
             
-            # Auto-save
+            # Auto-save; imports add many ROIs in a row, so coalesce
+            self.schedule_auto_save()
+
+    def schedule_auto_save(self, *_):
+        """Save settings once the current burst of changes has settled."""
+        self._save_timer.start()
+
+    def flush_auto_save(self):
+        """Write a scheduled save now, e.g. before the image path changes."""
+        if self._save_timer.isActive():
             self.auto_save_settings()
 
     def auto_save_settings(self):
         """Automatically save current settings if enabled."""
+        # An immediate save supersedes any scheduled one
+        self._save_timer.stop()
         if not self.settings_manager.is_auto_save_enabled():
             return
             
@@ -778,6 +869,8 @@ class ThermalAnalyzerNG(QMainWindow):
         # Primary image view (thermal)
         self.image_view = ImageGraphicsView()
         self.image_view.setStyleSheet("border: 1px solid gray; background-color: #222;")
+        if self._use_opengl:
+            self.image_view.enable_opengl_viewport()
         
         # Connect existing signals
         self.image_view.mouse_moved_on_thermal.connect(self.on_thermal_mouse_move)
@@ -796,6 +889,8 @@ class ThermalAnalyzerNG(QMainWindow):
         # Secondary image view (visible light)
         self.secondary_image_view = ImageGraphicsView()
         self.secondary_image_view.setStyleSheet("border: 1px solid gray; background-color: #222;")
+        if self._use_opengl:
+            self.secondary_image_view.enable_opengl_viewport()
         
         # Connect signals for secondary view
         self.secondary_image_view.drawing_tool_deactivation_requested.connect(self.deactivate_drawing_tools)
@@ -1360,6 +1455,7 @@ class ThermalAnalyzerNG(QMainWindow):
                 }
             """)
             line_edit.setToolTip(tooltip)
+            line_edit.textChanged.connect(self._invalidate_thermal_parameters)
             line_edit.editingFinished.connect(self.recalculate_and_update_view)
             self.param_inputs[key] = line_edit
             primary_layout.addRow(key.replace("ReflectedApparentTemperature", "Reflected Temp."), line_edit)
@@ -1390,6 +1486,7 @@ class ThermalAnalyzerNG(QMainWindow):
                 }
             """)
             line_edit.setToolTip(tooltip)
+            line_edit.textChanged.connect(self._invalidate_thermal_parameters)
             line_edit.editingFinished.connect(self.recalculate_and_update_view)
             self.param_inputs[key] = line_edit
             
@@ -1480,8 +1577,7 @@ class ThermalAnalyzerNG(QMainWindow):
         
         # Palette combo box
         self.palette_combo = QComboBox()
-        palette_names = list(PALETTE_MAP.keys())
-        self.palette_combo.addItems(palette_names)
+        self.palette_combo.addItems(PALETTE_NAMES)
         self.palette_combo.setCurrentText("Iron")
         self.palette_combo.setStyleSheet("""
             QComboBox {
@@ -1678,6 +1774,8 @@ class ThermalAnalyzerNG(QMainWindow):
         # Metadata display with improved styling
         self.all_meta_display = QTextEdit("All extracted metadata will appear here.")
         self.all_meta_display.setReadOnly(True)
+        # Read-only display: don't keep undo history for each metadata dump
+        self.all_meta_display.setUndoRedoEnabled(False)
         self.all_meta_display.setStyleSheet("""
             QTextEdit {
                 border: 1px solid palette(mid);
@@ -1918,17 +2016,19 @@ class ThermalAnalyzerNG(QMainWindow):
         table_scroll_area.setMaximumHeight(400)
         
         # Create table with enhanced styling and responsive behavior
-        self.roi_table = QTableWidget()
-        self.roi_table.setColumnCount(6)
-        headers = ["Name", "Emissivity", "Min (°C)", "Max (°C)", "Mean (°C)", "Median (°C)"]
-        self.roi_table.setHorizontalHeaderLabels(headers)
-        self.roi_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.roi_table.setSelectionMode(QTableWidget.MultiSelection) 
+        # The view reads ROIs and statistics straight from the controller
+        # through the model, so refreshes never rebuild per-cell items
+        self.roi_table_model = RoiTableModel(self.roi_controller, self)
+        self.roi_table = QTableView()
+        self.roi_table.setModel(self.roi_table_model)
+        self.roi_table.verticalHeader().setVisible(False)
+        self.roi_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.roi_table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.roi_table.setAlternatingRowColors(False)  # Disable alternating row colors
         self.roi_table.setSortingEnabled(False)
         self.roi_table.setMinimumWidth(400)  # Reduced from 500 to 400
         self.roi_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid palette(mid);
                 border-radius: 6px;
                 gridline-color: palette(mid);
@@ -1936,17 +2036,17 @@ class ThermalAnalyzerNG(QMainWindow):
                 background-color: palette(base);
                 color: palette(text);
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px 8px;
                 border: none;
                 min-height: 20px;
                 color: palette(text);
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: palette(highlight);
                 color: palette(highlighted-text);
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: palette(midlight);
             }
             QHeaderView::section {
@@ -1981,8 +2081,9 @@ class ThermalAnalyzerNG(QMainWindow):
         table_scroll_area.setWidget(self.roi_table)
         
         # Connect table signals
-        self.roi_table.itemSelectionChanged.connect(self.on_roi_table_selection_changed)
-        self.roi_table.itemChanged.connect(self.on_roi_table_item_changed)
+        self.roi_table.selectionModel().selectionChanged.connect(self.on_roi_table_selection_changed)
+        self.roi_table_model.roi_edited.connect(self.on_roi_table_edited)
+        self.roi_table_model.edit_rejected.connect(self.on_roi_table_edit_rejected)
         
         table_layout.addWidget(table_scroll_area)
         
@@ -2618,7 +2719,6 @@ class ThermalAnalyzerNG(QMainWindow):
         self.roi_start_pos = None
         self.temp_roi_item = None
         self.is_drawing_roi = False
-        self._updating_roi_table = False
         
         # Application state
         self.current_image_path = None
@@ -2719,13 +2819,13 @@ class ThermalAnalyzerNG(QMainWindow):
             idx (int): Index of the selected palette.
         """
         self.selected_palette = self.palette_combo.currentText()
-        self.update_view_only()
+        self.update_colormap_only()
 
     def on_invert_palette(self):
         """Handle palette inversion toggle."""
         self.palette_inverted = not self.palette_inverted
-        self.update_view_only()
-        self.auto_save_settings()  # Era save_settings_to_json()
+        self.update_colormap_only()
+        self.schedule_auto_save()
         
     def on_range_mode_changed(self, mode: str):
         """
@@ -2745,8 +2845,8 @@ class ThermalAnalyzerNG(QMainWindow):
             self.thermal_engine.temp_min = self.manual_temp_min
             self.thermal_engine.temp_max = self.manual_temp_max
             
-        self.update_view_only()
-        self.auto_save_settings()
+        self.update_colormap_only()
+        self.schedule_auto_save()
         
     def on_manual_range_changed(self):
         """Handle manual temperature range changes."""
@@ -2769,8 +2869,8 @@ class ThermalAnalyzerNG(QMainWindow):
             self.thermal_engine.temp_min = min_val
             self.thermal_engine.temp_max = max_val
             
-            self.update_view_only()
-            self.auto_save_settings()
+            self.update_colormap_only()
+            self.schedule_auto_save()
             
     def _update_autorange(self):
         """Update temperature range automatically from data."""
@@ -2785,40 +2885,6 @@ class ThermalAnalyzerNG(QMainWindow):
                 self.temp_min_spin.blockSignals(False)
                 self.temp_max_spin.blockSignals(False)
         
-    def on_thermal_mouse_move(self, point: QPointF):
-        """
-        Handle mouse movement over thermal image to display temperature tooltip.
-        
-        Args:
-            point (QPointF): Mouse position in image coordinates.
-        """
-        if not hasattr(self, 'thermal_engine') or self.thermal_engine.temperature_data is None:
-            self.temp_tooltip_label.setVisible(False)
-            return
-            
-        img_h, img_w = self.thermal_engine.temperature_data.shape
-        matrix_x = int(point.x())
-        matrix_y = int(point.y())
-        
-        # Check if point is within image bounds
-        if 0 <= matrix_x < img_w and 0 <= matrix_y < img_h:
-            temperature = self.thermal_engine.get_temperature_at_point(matrix_x, matrix_y)
-            if not np.isnan(temperature):
-                try:
-                    emissivity = float(self.param_inputs["Emissivity"].text())
-                    self.temp_tooltip_label.setText(f"{temperature:.2f} °C | ε: {emissivity:.3f}")
-                except (ValueError, KeyError):
-                    self.temp_tooltip_label.setText(f"{temperature:.2f} °C")
-                    
-                # Position tooltip near cursor
-                cursor_pos = self.image_view.mapFromGlobal(self.cursor().pos())
-                self.temp_tooltip_label.move(cursor_pos.x() + 10, cursor_pos.y() + 10)
-                self.temp_tooltip_label.setVisible(True)
-                self.temp_tooltip_label.adjustSize()
-                return
-        
-        self.temp_tooltip_label.setVisible(False)
-        
     def display_images(self):
         """
         Update the display of images in the view.
@@ -2830,8 +2896,8 @@ class ThermalAnalyzerNG(QMainWindow):
         if hasattr(self, 'thermal_engine'):
             self.base_pixmap_visible = self.thermal_engine.base_pixmap_visible
         
-        print(f"display_images called: overlay_mode={self.overlay_mode}, "
-              f"visible_available={self.base_pixmap_visible is not None}")
+        log.debug("display_images called: overlay_mode=%s, visible_available=%s",
+                  self.overlay_mode, self.base_pixmap_visible is not None)
         
         if self.overlay_mode:
             # Overlay mode: show thermal over visible
@@ -2849,6 +2915,8 @@ class ThermalAnalyzerNG(QMainWindow):
                 blend_mode=blend_mode
             )
             self.secondary_image_view.setVisible(False)
+            # Hidden views may be resized, so refit when shown again
+            self._secondary_display_key = None
         else:
             # Side-by-side mode: show thermal and visible separately
             self.image_view.update_overlay(visible=False)
@@ -2866,14 +2934,22 @@ class ThermalAnalyzerNG(QMainWindow):
         if hasattr(self, 'thermal_engine'):
             self.base_pixmap_visible = self.thermal_engine.base_pixmap_visible
         
-        print(f"display_secondary_image called, pixmap available: {self.base_pixmap_visible is not None}")
+        log.debug("display_secondary_image called, pixmap available: %s", self.base_pixmap_visible is not None)
         
         if self.base_pixmap_visible is not None:
+            # Thermal redraws re-run display_images with the same visible
+            # image; only refit when the image or the view size changed
+            display_key = (self.base_pixmap_visible.cacheKey(),
+                           self.secondary_image_view.viewport().size())
+            if display_key == self._secondary_display_key:
+                return
             self.secondary_image_view.set_thermal_pixmap(self.base_pixmap_visible)
-            print(f"Secondary view pixmap set, size: {self.base_pixmap_visible.size()}")
+            self._secondary_display_key = display_key
+            log.debug("Secondary view pixmap set, size: %s", self.base_pixmap_visible.size())
         else:
             self.secondary_image_view.set_thermal_pixmap(QPixmap())
-            print("Secondary view cleared - no visible image available")
+            self._secondary_display_key = None
+            log.debug("Secondary view cleared - no visible image available")
 
     def zoom_in(self):
         """Zoom in both image views."""
@@ -2921,8 +2997,7 @@ class ThermalAnalyzerNG(QMainWindow):
             value (int): Opacity value (0-100).
         """
         self.overlay_alpha = max(0.0, min(1.0, value / 100.0))
-        if self.overlay_mode:
-            self.display_images()
+        self._schedule_overlay_update()
 
     def on_scale_spin_changed(self, value: float):
         """
@@ -2932,13 +3007,8 @@ class ThermalAnalyzerNG(QMainWindow):
             value (float): Scale factor for thermal overlay.
         """
         self.overlay_scale = float(value)
-        if self.overlay_mode:
-            self.display_images()
-            if hasattr(self.image_view, 'get_scale_info'):
-                scale_info = self.image_view.get_scale_info()
-                print(f"Scale info: {scale_info}")
-        # Save settings after updating the variable
-        self.auto_save_settings()
+        self._overlay_settings_dirty = True
+        self._schedule_overlay_update()
 
     def on_offsetx_changed(self, value: int):
         """
@@ -2948,10 +3018,8 @@ class ThermalAnalyzerNG(QMainWindow):
             value (int): X offset in pixels.
         """
         self.overlay_offset_x = float(value)
-        if self.overlay_mode:
-            self.display_images()
-        # Save settings after updating the variable
-        self.auto_save_settings()
+        self._overlay_settings_dirty = True
+        self._schedule_overlay_update()
 
     def on_offsety_changed(self, value: int):
         """
@@ -2961,10 +3029,40 @@ class ThermalAnalyzerNG(QMainWindow):
             value (int): Y offset in pixels.
         """
         self.overlay_offset_y = float(value)
+        self._overlay_settings_dirty = True
+        self._schedule_overlay_update()
+
+    def _schedule_overlay_update(self):
+        """
+        Schedule an overlay recomposite for the next frame.
+        
+        The timer is not restarted while it is pending: restarting on every
+        value would postpone the redraw until the user pauses, whereas this
+        keeps redrawing at frame rate during a continuous drag, always with
+        the latest stored values.
+        """
+        if not self._overlay_timer.isActive():
+            self._overlay_timer.start()
+
+    def _apply_overlay_changes(self):
+        """
+        Apply the overlay values stashed by the alpha/scale/offset handlers.
+        
+        Called by the overlay timer once per display frame, so a slider drag or
+        a held spin box arrow recomposites the overlay once per frame instead
+        of once per intermediate value.
+        """
         if self.overlay_mode:
             self.display_images()
-        # Save settings after updating the variable
-        self.auto_save_settings()
+            if (self._overlay_settings_dirty and hasattr(self.image_view, 'get_scale_info')
+                    and log.isEnabledFor(logging.DEBUG)):
+                log.debug("Scale info: %s", self.image_view.get_scale_info())
+        
+        # Save settings only when alignment changed (opacity is not persisted
+        # here); a drag would otherwise write the file once per frame
+        if self._overlay_settings_dirty:
+            self._overlay_settings_dirty = False
+            self.schedule_auto_save()
 
     def on_reset_alignment(self):
         """Reset overlay alignment to metadata values."""
@@ -2979,19 +3077,15 @@ class ThermalAnalyzerNG(QMainWindow):
         self.overlay_offset_x = float(overlay_params.get("offset_x", 0.0))
         self.overlay_offset_y = float(overlay_params.get("offset_y", 0.0))
         
-        # Update UI controls
-        try:
-            self.scale_spin.blockSignals(True)
-            self.offsetx_spin.blockSignals(True)
-            self.offsety_spin.blockSignals(True)
-            
-            self.scale_spin.setValue(self.overlay_scale)
-            self.offsetx_spin.setValue(int(round(self.overlay_offset_x)))
-            self.offsety_spin.setValue(int(round(self.overlay_offset_y)))
-        finally:
-            self.scale_spin.blockSignals(False)
-            self.offsetx_spin.blockSignals(False)
-            self.offsety_spin.blockSignals(False)
+        # Update UI controls; the blockers restore the previous signal state
+        # when released, even if a setValue raises
+        blockers = [QSignalBlocker(spin) for spin in
+                    (self.scale_spin, self.offsetx_spin, self.offsety_spin)]
+        self.scale_spin.setValue(self.overlay_scale)
+        self.offsetx_spin.setValue(int(round(self.overlay_offset_x)))
+        self.offsety_spin.setValue(int(round(self.overlay_offset_y)))
+        for blocker in blockers:
+            blocker.unblock()
             
         # Update display
         self.display_images()
@@ -3026,22 +3120,7 @@ class ThermalAnalyzerNG(QMainWindow):
         Returns:
             QPainter.CompositionMode: Qt composition mode constant.
         """
-        mapping = {
-            "Normal": QPainter.CompositionMode_SourceOver,
-            "Multiply": QPainter.CompositionMode_Multiply,
-            "Screen": QPainter.CompositionMode_Screen,
-            "Overlay": QPainter.CompositionMode_Overlay,
-            "Darken": QPainter.CompositionMode_Darken,
-            "Lighten": QPainter.CompositionMode_Lighten,
-            "ColorDodge": QPainter.CompositionMode_ColorDodge,
-            "ColorBurn": QPainter.CompositionMode_ColorBurn,
-            "HardLight": QPainter.CompositionMode_HardLight,
-            "SoftLight": QPainter.CompositionMode_SoftLight,
-            "Difference": QPainter.CompositionMode_Difference,
-            "Exclusion": QPainter.CompositionMode_Exclusion,
-            "Additive": QPainter.CompositionMode_Plus,
-        }
-        return mapping.get(self.overlay_blend_mode, QPainter.CompositionMode_SourceOver)
+        return self.BLEND_MODES.get(self.overlay_blend_mode, QPainter.CompositionMode_SourceOver)
 
     def set_overlay_controls_visible(self, visible: bool):
         """Set visibility of overlay control widgets.
@@ -3049,6 +3128,12 @@ class ThermalAnalyzerNG(QMainWindow):
         Args:
             visible (bool): Whether overlay controls should be visible.
         """
+        # Syncing the menu and toolbar actions re-enters the overlay toggle
+        # with the same state; the widgets are already up to date then
+        if getattr(self, '_overlay_controls_visible', None) == visible:
+            return
+        self._overlay_controls_visible = visible
+        
         # Update menu action if it exists
         if hasattr(self, 'overlay_action') and self.overlay_action is not None:
             self.overlay_action.setChecked(visible)
@@ -3083,11 +3168,29 @@ class ThermalAnalyzerNG(QMainWindow):
             event: Qt resize event.
         """
         super().resizeEvent(event)
+        # Restarted on every resize tick, so only the final size refits
+        if hasattr(self, '_resize_timer'):
+            self._resize_timer.start()
+
+    def _on_resize_settled(self):
+        """Refit the secondary view after the window size stopped changing."""
         if (hasattr(self, 'secondary_image_view') and 
             hasattr(self, 'base_pixmap_visible') and 
             self.base_pixmap_visible is not None):
             self.display_secondary_image()
 
+    def closeEvent(self, event):
+        """
+        Handle window close events by writing pending settings and stopping
+        the persistent exiftool process.
+        
+        Args:
+            event: Qt close event.
+        """
+        self.flush_auto_save()
+        self.thermal_engine.shutdown_exiftool()
+        super().closeEvent(event)
+
     def sync_views(self):
         """Synchronize zoom and pan between the two ImageGraphicsView instances."""
         self.image_view.view_transformed.connect(self.on_primary_view_transformed)
@@ -3124,13 +3227,13 @@ class ThermalAnalyzerNG(QMainWindow):
         This method delegates to the ROI controller to update all ROI statistics
         and then refreshes the UI components.
         """
-        print("Updating ROI analysis...")
+        log.debug("Updating ROI analysis...")
         
         # Use ROI controller to update all analyses
         self.roi_controller.update_all_analyses()
         
         # The controller will emit analysis_updated signal which triggers on_roi_analysis_updated
-        print("ROI analysis update requested")
+        log.debug("ROI analysis update requested")
 
     def update_roi_table(self):
         """Update the ROI table with current data.
@@ -3138,85 +3241,20 @@ class ThermalAnalyzerNG(QMainWindow):
         This method refreshes the ROI analysis table with current ROI data and
         calculated temperature statistics.
         """
-        print("Updating ROI table...")
-        self._updating_roi_table = True
-        
-        blocker = None  # Initialize outside try block
+        log.debug("Updating ROI table...")
         try:
-            # Block signals during update to prevent recursion
-            blocker = QSignalBlocker(self.roi_table)
-
-            # Get all ROIs from controller
-            all_rois = self.roi_controller.get_all_rois()
-            
-            # Clear and recreate table content
-            self.roi_table.setRowCount(0)
-            self.roi_table.clearContents()
-            self.roi_table.setRowCount(len(all_rois))
-
-            for row, roi in enumerate(all_rois):
-                # Name column (editable)
-                name_item = QTableWidgetItem(roi.name)
-                name_item.setData(Qt.UserRole, roi.id)  # Store ROI ID for reference
-                self.roi_table.setItem(row, 0, name_item)
-
-                # Emissivity column (editable)
-                emissivity_value = getattr(roi, 'emissivity', 0.95)
-                emissivity_item = QTableWidgetItem(f"{emissivity_value:.3f}")
-                self.roi_table.setItem(row, 1, emissivity_item)
-
-                # Temperature statistics columns (read-only)
-                if (hasattr(roi, 'temp_min') and roi.temp_min is not None and 
-                    hasattr(roi, 'temp_max') and roi.temp_max is not None and
-                    hasattr(roi, 'temp_mean') and roi.temp_mean is not None):
-                    
-                    min_item = QTableWidgetItem(f"{roi.temp_min:.2f}")
-                    max_item = QTableWidgetItem(f"{roi.temp_max:.2f}")
-                    avg_item = QTableWidgetItem(f"{roi.temp_mean:.2f}")
-                    
-                    # Handle median value
-                    median_value = getattr(roi, 'temp_median', None)
-                    median_item = QTableWidgetItem(
-                        f"{median_value:.2f}" if median_value is not None else "N/A"
-                    )
-                else:
-                    # No temperature data available
-                    min_item = QTableWidgetItem("N/A")
-                    max_item = QTableWidgetItem("N/A")
-                    avg_item = QTableWidgetItem("N/A")
-                    median_item = QTableWidgetItem("N/A")
-
-                # Make temperature columns read-only and visually distinct
-                for item in [min_item, max_item, avg_item, median_item]:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                    palette = QApplication.palette()
-                    disabled_color = palette.color(palette.ColorRole.Window)
-                    item.setBackground(disabled_color)
-
-                # Set items in table
-                self.roi_table.setItem(row, 2, min_item)
-                self.roi_table.setItem(row, 3, max_item)
-                self.roi_table.setItem(row, 4, avg_item)
-                self.roi_table.setItem(row, 5, median_item)
-
-            print(f"ROI table updated with {len(all_rois)} rows")
-            
+            # The model re-reads the controller and notifies the view in one go
+            self.roi_table_model.refresh()
+            log.debug("ROI table updated with %d rows", self.roi_table_model.rowCount())
         except Exception as e:
             print(f"Error updating ROI table: {e}")
-        finally:
-            if blocker is not None:
-                del blocker  # Re-enable signals
-            self._updating_roi_table = False
 
-
-
-    def on_roi_table_selection_changed(self):
+    def on_roi_table_selection_changed(self, *_):
         """Handle selection changes in the ROI table."""
-        current_row = self.roi_table.currentRow()
-        all_rois = self.roi_controller.get_all_rois()
+        current_row = self.roi_table.currentIndex().row()
+        roi = self.roi_table_model.roi_at(current_row)
         
-        if current_row >= 0 and current_row < len(all_rois):
-            roi = all_rois[current_row]
+        if roi is not None:
             if str(roi.id) in self.roi_items:
                 roi_item = self.roi_items[str(roi.id)]
                 
@@ -3228,76 +3266,38 @@ class ThermalAnalyzerNG(QMainWindow):
                 roi_item.setSelected(True)
                 self.image_view.centerOn(roi_item)
 
-    def on_roi_table_item_changed(self, item):
+    def on_roi_table_edited(self, roi):
         """
-        Handle changes to ROI table items.
+        Handle a name or emissivity edit applied through the ROI table.
         
         Args:
-            item (QTableWidgetItem): The changed table item.
+            roi: The edited ROI model.
         """
-        if item is None or self._updating_roi_table:
-            return
-            
-        row = item.row()
-        col = item.column()
-        
-        all_rois = self.roi_controller.get_all_rois()
-        if row >= len(all_rois):
-            return
-            
-        roi = all_rois[row]
-        
-        if col == 0:
-            # Name column changed
-            new_name = item.text().strip()
-            if new_name:
-                # Update via controller
-                self.roi_controller.update_roi(roi.id, name=new_name)
-                print(f"Updated ROI name to: {new_name}")
-            else:
-                item.setText(roi.name)  # Restore original name
-                
-        elif col == 1:
-            # Emissivity column changed
-            try:
-                new_emissivity = float(item.text())
-                if 0.0 <= new_emissivity <= 1.0:
-                    # Update via controller
-                    self.roi_controller.update_roi(roi.id, emissivity=new_emissivity)
-                    print(f"Updated ROI emissivity to: {new_emissivity}")
-                else:
-                    # Invalid range - restore original value
-                    emissivity_value = getattr(roi, 'emissivity', 0.95)
-                    item.setText(f"{emissivity_value:.3f}")
-                    QMessageBox.warning(self, "Invalid Emissivity", 
-                                      "Emissivity must be between 0.0 and 1.0")
-            except ValueError:
-                # Invalid number - restore original value
-                emissivity_value = getattr(roi, 'emissivity', 0.95)
-                item.setText(f"{emissivity_value:.3f}")
-                QMessageBox.warning(self, "Invalid Emissivity", 
-                                  "Please enter a valid number for emissivity")
-                                  
         # Refresh the visual label on the ROI item
         item_view = self.roi_items.get(str(roi.id))
         if item_view and hasattr(item_view, "refresh_label"):
             item_view.refresh_label()
 
+    def on_roi_table_edit_rejected(self, title, message):
+        """
+        Warn about an invalid value entered in the ROI table.
+        
+        Args:
+            title (str): Dialogue title.
+            message (str): Explanation shown to the user.
+        """
+        QMessageBox.warning(self, title, message)
+
     def delete_selected_roi(self):
         """Delete all selected ROIs from the table."""
-        selected_rows = []
-        for item in self.roi_table.selectedItems():
-            row = item.row()
-            if row not in selected_rows:
-                selected_rows.append(row)
+        # One index per selected row; the controller deletes by ID, so the
+        # rows need no particular order
+        selected_rows = [index.row() for index in self.roi_table.selectionModel().selectedRows()]
         
         if not selected_rows:
             QMessageBox.information(self, "No Selection", 
                                   "Please select one or more ROIs to delete.")
             return
-            
-        # Sort in reverse order to delete from bottom up
-        selected_rows.sort(reverse=True)
         
         # Confirm deletion for multiple ROIs
         if len(selected_rows) > 1:
@@ -3310,14 +3310,12 @@ class ThermalAnalyzerNG(QMainWindow):
             if reply != QMessageBox.Yes:
                 return
                 
-        # Get all ROIs from controller
-        all_rois = self.roi_controller.get_all_rois()
-        
-        # Collect ROI IDs to delete
+        # Collect ROI IDs to delete from the rows shown in the table
         roi_ids_to_delete = []
         for row in selected_rows:
-            if row < len(all_rois):
-                roi_ids_to_delete.append(all_rois[row].id)
+            roi = self.roi_table_model.roi_at(row)
+            if roi is not None:
+                roi_ids_to_delete.append(roi.id)
                 
         # Delete ROIs using controller
         deleted_count = self.roi_controller.delete_rois(roi_ids_to_delete)
@@ -3575,13 +3573,10 @@ class ThermalAnalyzerNG(QMainWindow):
             # Clear existing ROIs first
             self.roi_controller.clear_all_rois()
             
-            # Import ROIs using the controller
+            # Import ROIs using the controller, which analyses them in one
+            # batch once all are created
             imported_count = self.roi_controller.import_roi_data(rois_data)
-            print(f"Loaded {imported_count} ROIs from settings")
-            
-            # Update analysis if temperature data is available
-            if hasattr(self, 'thermal_engine') and self.thermal_engine.thermal_data is not None:
-                self.roi_controller.update_all_analyses()
+            log.debug("Loaded %d ROIs from settings", imported_count)
                 
         except Exception as e:
             print(f"Error loading ROIs: {e}")
@@ -3602,25 +3597,25 @@ class ThermalAnalyzerNG(QMainWindow):
         # Connect thermal parameter input signals
         for param_input in self.param_inputs.values():
             if hasattr(param_input, 'editingFinished'):
-                param_input.editingFinished.connect(self.auto_save_settings)
+                param_input.editingFinished.connect(self.schedule_auto_save)
                 
         # Connect palette control signals
         if hasattr(self, 'palette_combo'):
-            self.palette_combo.currentTextChanged.connect(self.auto_save_settings)
+            self.palette_combo.currentTextChanged.connect(self.schedule_auto_save)
             
         # Connect range control signals
         if hasattr(self, 'range_mode_combo'):
-            self.range_mode_combo.currentTextChanged.connect(self.auto_save_settings)
+            self.range_mode_combo.currentTextChanged.connect(self.schedule_auto_save)
         if hasattr(self, 'temp_min_spin'):
-            self.temp_min_spin.valueChanged.connect(self.auto_save_settings)
+            self.temp_min_spin.valueChanged.connect(self.schedule_auto_save)
         if hasattr(self, 'temp_max_spin'):
-            self.temp_max_spin.valueChanged.connect(self.auto_save_settings)
+            self.temp_max_spin.valueChanged.connect(self.schedule_auto_save)
             
         # Connect overlay control signals
         if hasattr(self, 'overlay_alpha_slider'):
-            self.overlay_alpha_slider.valueChanged.connect(self.auto_save_settings)
+            self.overlay_alpha_slider.valueChanged.connect(self.schedule_auto_save)
         if hasattr(self, 'blend_combo'):
-            self.blend_combo.currentTextChanged.connect(self.auto_save_settings)
+            self.blend_combo.currentTextChanged.connect(self.schedule_auto_save)
         
         self._auto_save_connected = True
         print("Auto-save signals connected")
@@ -4057,7 +4052,7 @@ class ThermalAnalyzerNG(QMainWindow):
         Args:
             roi_model: The ROI model with updated geometry from UI.
         """
-        print(f"🔄 ROI modified from UI: {roi_model.name} (ID: {roi_model.id})")
+        log.debug("ROI modified from UI: %s (ID: %s)", roi_model.name, roi_model.id)
         
         if not hasattr(self, 'roi_controller'):
             print("❌ ROI controller not available")
@@ -4093,14 +4088,7 @@ class ThermalAnalyzerNG(QMainWindow):
         # on_roi_analysis_updated() that handles UI updates
         
         # Delay auto-save to avoid spam during dragging
-        if not hasattr(self, '_roi_save_timer'):
-            from PySide6.QtCore import QTimer
-            self._roi_save_timer = QTimer()
-            self._roi_save_timer.setSingleShot(True)
-            self._roi_save_timer.timeout.connect(self.auto_save_settings)
-        
-        # Restart timer (500ms delay)
-        self._roi_save_timer.start(500)
+        self.schedule_auto_save()
 
     def reset_params_to_exif(self):
         """
@@ -4275,36 +4263,64 @@ class ThermalAnalyzerNG(QMainWindow):
         """
         Handle mouse movement over thermal image to display temperature tooltip.
         
+        Mouse events can arrive far faster than the screen refreshes, so only
+        the latest position is kept and the tooltip is updated once per frame.
+        
         Args:
             point (QPointF): Mouse position in image coordinates.
         """
+        self._tooltip_point = point
+        if not self._tooltip_timer.isActive():
+            self._tooltip_timer.start()
+
+    def _update_temperature_tooltip(self):
+        """Update the temperature tooltip for the latest mouse position."""
+        point = self._tooltip_point
+        if point is None:
+            return
+        
         if not hasattr(self, 'thermal_engine') or self.thermal_engine.temperature_data is None:
             self.temp_tooltip_label.setVisible(False)
             return
             
-        img_h, img_w = self.thermal_engine.temperature_data.shape
-        matrix_x = int(point.x())
-        matrix_y = int(point.y())
-        
-        # Check if point is within image bounds
-        if 0 <= matrix_x < img_w and 0 <= matrix_y < img_h:
-            temperature = self.thermal_engine.get_temperature_at_point(matrix_x, matrix_y)
-            if not np.isnan(temperature):
-                try:
-                    thermal_params = self.get_current_thermal_parameters()
-                    emissivity = thermal_params.get("Emissivity", 0.95)
-                    self.temp_tooltip_label.setText(f"{temperature:.2f} °C | ε: {emissivity:.3f}")
-                except (ValueError, KeyError):
-                    self.temp_tooltip_label.setText(f"{temperature:.2f} °C")
-                    
-                # Position tooltip near cursor
-                cursor_pos = self.image_view.mapFromGlobal(self.cursor().pos())
-                self.temp_tooltip_label.move(cursor_pos.x() + 10, cursor_pos.y() + 10)
-                self.temp_tooltip_label.setVisible(True)
-                self.temp_tooltip_label.adjustSize()
+        # The point is already in image pixels (mapped through the item
+        # transform by the view); the engine bounds-checks it and returns NaN
+        # outside the image
+        pixel = (int(point.x()), int(point.y()))
+        label = self.temp_tooltip_label
+        
+        # Sub-pixel jitter stays on the same pixel, where only the tooltip
+        # position changes; the reading is redone after recalculation (see
+        # on_temperatures_calculated) or when the label was hidden
+        if pixel != self._tooltip_pixel or not label.isVisible():
+            temperature = self.thermal_engine.get_temperature_at_point(*pixel)
+            # NaN is the only value unequal to itself: a plain comparison
+            # instead of an np.isnan ufunc call per update
+            if temperature != temperature:
+                self._tooltip_pixel = None
+                if label.isVisible():
+                    label.setVisible(False)
                 return
-        
-        self.temp_tooltip_label.setVisible(False)
+            
+            try:
+                thermal_params = self.get_current_thermal_parameters()
+                emissivity = thermal_params.get("Emissivity", 0.95)
+                text = f"{temperature:.2f} °C | ε: {emissivity:.3f}"
+            except (ValueError, KeyError):
+                text = f"{temperature:.2f} °C"
+            
+            # Neighbouring pixels often read the same rounded value, so the
+            # label is only re-laid out when its text actually changes
+            if label.text() != text:
+                label.setText(text)
+                label.adjustSize()
+            self._tooltip_pixel = pixel
+            
+        # Position tooltip near cursor
+        cursor_pos = self.image_view.mapFromGlobal(self.cursor().pos())
+        label.move(cursor_pos.x() + 10, cursor_pos.y() + 10)
+        if not label.isVisible():
+            label.setVisible(True)
 
 
 
@@ -4315,7 +4331,7 @@ class ThermalAnalyzerNG(QMainWindow):
 
     def on_roi_removed(self, roi_id: str):
         """Handle ROI removed event from ROIController."""
-        print(f"ROI removed: {roi_id}")
+        log.debug("ROI removed: %s", roi_id)
         
         # Remove from scene
         if roi_id in self.roi_items:
@@ -4326,12 +4342,12 @@ class ThermalAnalyzerNG(QMainWindow):
         # Update table
         self.update_roi_table()
         
-        # Auto-save
-        self.auto_save_settings()
+        # Auto-save; multi-selection deletes remove ROIs in a row
+        self.schedule_auto_save()
 
     def on_rois_cleared(self):
         """Handle ROIs cleared event from ROIController."""
-        print("All ROIs cleared")
+        log.debug("All ROIs cleared")
         
         # Remove all items from scene
         for roi_item in self.roi_items.values():
@@ -4344,11 +4360,11 @@ class ThermalAnalyzerNG(QMainWindow):
         self.update_roi_table()
         
         # Auto-save
-        self.auto_save_settings()
+        self.schedule_auto_save()
 
     def on_roi_analysis_updated(self):
         """Handle ROI analysis updated event from ROIController."""
-        print("ROI analysis updated")
+        log.debug("ROI analysis updated")
         
         # Refresh all ROI labels
         for roi_model in self.roi_controller.get_all_rois():
@@ -4379,11 +4395,24 @@ class ThermalAnalyzerNG(QMainWindow):
         if not hasattr(self, 'thermal_engine') or self.thermal_engine.temperature_data is None:
             return
             
-        print(">>> Updating visualisation only...")
+        log.debug(">>> Updating visualisation only...")
         self.update_thermal_display()
         self.update_legend()
         self.display_images()
 
+    def update_colormap_only(self):
+        """
+        Recolor the thermal image and legend after a palette or range change.
+        
+        Unlike update_view_only, the visible image and overlay layout are left
+        untouched, since only the thermal pixmap's colors change.
+        """
+        if not hasattr(self, 'thermal_engine') or self.thermal_engine.temperature_data is None:
+            return
+        
+        self.update_thermal_display()
+        self.update_legend()
+
     def load_preset_json(self):
         """
         Load a preset JSON file containing thermal analysis configuration.
@@ -4601,7 +4630,10 @@ class ThermalAnalyzerNG(QMainWindow):
         failed_images = []
         
         try:
-            for i, image_path in enumerate(self.batch_images):
+            # The next image's exiftool extraction runs in the background
+            # while the current one is processed
+            batch_files = self.thermal_engine.iter_thermal_files(self.batch_images)
+            for i, (image_path, file_data) in enumerate(batch_files):
                 try:
                     # Update progress
                     self.batch_progress.setValue(i)
@@ -4610,7 +4642,7 @@ class ThermalAnalyzerNG(QMainWindow):
                     print(f"Processing image {i+1}/{len(self.batch_images)}: {os.path.basename(image_path)}")
                     
                     # Process single image with preset
-                    success = self._process_single_image_with_preset(image_path, output_dir)
+                    success = self._process_single_image_with_preset(image_path, output_dir, file_data)
                     
                     if success:
                         processed_count += 1
@@ -4724,7 +4756,8 @@ class ThermalAnalyzerNG(QMainWindow):
         finally:
             self._ignore_auto_save = False
 
-    def _process_single_image_with_preset(self, image_path: str, output_dir: str) -> bool:
+    def _process_single_image_with_preset(self, image_path: str, output_dir: str,
+                                          file_data: tuple = None) -> bool:
         """
         Process a single image with the loaded preset and export analysis.
         
@@ -4734,6 +4767,7 @@ class ThermalAnalyzerNG(QMainWindow):
         Args:
             image_path (str): Path to the thermal image to process
             output_dir (str): Directory where to save exported files
+            file_data (tuple): Prefetched exiftool data for the image, if any
             
         Returns:
             bool: True if processing and export were successful
@@ -4743,7 +4777,7 @@ class ThermalAnalyzerNG(QMainWindow):
             
             # Load the thermal image
             print(f"📂 Loading thermal image: {image_path}")
-            if not self.thermal_engine.load_thermal_image(image_path):
+            if not self.thermal_engine.load_thermal_image(image_path, file_data):
                 print(f"❌ Failed to load image: {image_path}")
                 return False
             
@@ -4868,28 +4902,20 @@ class ThermalAnalyzerNG(QMainWindow):
     def update_metadata_display(self):
         """Update the metadata display with all extracted metadata."""
         if not self.thermal_engine.metadata:
-            self.all_meta_display.setText("No metadata available.")
+            self.all_meta_display.setPlainText("No metadata available.")
             return
         
-        # Format all metadata for display
-        metadata_text = "EXTRACTED METADATA:\n" + "="*50 + "\n\n"
-        
         # Group metadata by prefix for better organization
         groups = {}
         for key, value in self.thermal_engine.metadata.items():
-            if ":" in key:
-                prefix = key.split(":")[0]
-            else:
-                prefix = "General"
-            
-            if prefix not in groups:
-                groups[prefix] = []
-            groups[prefix].append((key, value))
+            prefix = key.split(":")[0] if ":" in key else "General"
+            groups.setdefault(prefix, []).append((key, value))
         
-        # Display metadata by groups
+        # Format all metadata for display, collecting lines and joining once
+        lines = ["EXTRACTED METADATA:", "=" * 50, ""]
         for group_name, items in sorted(groups.items()):
-            metadata_text += f"[{group_name}]\n"
-            metadata_text += "-" * 30 + "\n"
+            lines.append(f"[{group_name}]")
+            lines.append("-" * 30)
             
             for key, value in sorted(items):
                 # Format the value appropriately
@@ -4901,8 +4927,9 @@ class ThermalAnalyzerNG(QMainWindow):
                 else:
                     formatted_value = str(value)
                 
-                metadata_text += f"{key}: {formatted_value}\n"
+                lines.append(f"{key}: {formatted_value}")
             
-            metadata_text += "\n"
+            lines.append("")
         
-        self.all_meta_display.setText(metadata_text)
+        # Plain text skips the rich-text detection and HTML parsing of setText
+        self.all_meta_display.setPlainText("\n".join(lines) + "\n")
@@ -6,11 +6,36 @@ ROIs (Regions of Interest) in a QGraphicsScene.
 """
 
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsItem, QGraphicsTextItem, QGraphicsEllipseItem, QGraphicsPolygonItem
-from PySide6.QtGui import QPen, QBrush, QColor, QCursor, QPolygonF
+from PySide6.QtGui import QPen, QBrush, QColor, QCursor, QPolygonF, QFontMetrics
 from PySide6.QtCore import Qt, QRectF, QPointF
 from analysis.roi_models import RectROI, SpotROI, PolygonROI
 
 
+# Handle brushes are re-applied on every hover move over an ROI, so they are
+# built once here instead of per handle and per event
+_RECT_HANDLE_HIGHLIGHT_BRUSH = QBrush(QColor(255, 255, 0, 150))  # Yellow highlight
+_RECT_HANDLE_NORMAL_BRUSH = QBrush(QColor(255, 255, 255, 100))  # Normal white
+_HANDLE_HIGHLIGHT_BRUSH = QBrush(QColor(255, 150, 0, 220))  # Bright orange
+_HANDLE_NORMAL_BRUSH = QBrush(QColor(100, 150, 255, 180))  # Semi-transparent blue
+
+# Label font metrics, keyed by QFont.key(); labels are re-measured on every
+# move or resize of their ROI
+_label_metrics_cache = {}
+
+
+def _label_metrics(font) -> QFontMetrics:
+    """Return cached font metrics for an ROI label font.
+    
+    Args:
+        font (QFont): Font of the label.
+    """
+    key = font.key()
+    metrics = _label_metrics_cache.get(key)
+    if metrics is None:
+        metrics = _label_metrics_cache[key] = QFontMetrics(font)
+    return metrics
+
+
 class RectROIItem(QGraphicsRectItem):
     """
     Graphical representation of a rectangular ROI for use in QGraphicsScene.
@@ -163,9 +188,9 @@ class RectROIItem(QGraphicsRectItem):
             
         for key, handle_item in self._handle_items.items():
             if key == handle_key:
-                handle_item.setBrush(QBrush(QColor(255, 255, 0, 150)))  # Yellow highlight
+                handle_item.setBrush(_RECT_HANDLE_HIGHLIGHT_BRUSH)
             else:
-                handle_item.setBrush(QBrush(QColor(255, 255, 255, 100)))  # Normal white
+                handle_item.setBrush(_RECT_HANDLE_NORMAL_BRUSH)
 
     def itemChange(self, change, value):
         """
@@ -549,9 +574,7 @@ class RectROIItem(QGraphicsRectItem):
         self.label.setPos(label_x, label_y)
         
         # Calculate precise text dimensions using font metrics
-        font = self.label.font()
-        from PySide6.QtGui import QFontMetrics
-        metrics = QFontMetrics(font)
+        metrics = _label_metrics(self.label.font())
         text = self.label.toPlainText()
         lines = text.split('\n')
         
@@ -722,12 +745,10 @@ class SpotROIItem(QGraphicsEllipseItem):
         for key, handle_item in handle_items.items():
             if key == handle_key:
                 # Highlight this handle
-                highlight_brush = QBrush(QColor(255, 150, 0, 220))  # Bright orange
-                handle_item.setBrush(highlight_brush)
+                handle_item.setBrush(_HANDLE_HIGHLIGHT_BRUSH)
             else:
                 # Normal color
-                normal_brush = QBrush(QColor(100, 150, 255, 180))
-                handle_item.setBrush(normal_brush)
+                handle_item.setBrush(_HANDLE_NORMAL_BRUSH)
 
     def itemChange(self, change, value):
         """
@@ -1055,9 +1076,7 @@ class SpotROIItem(QGraphicsEllipseItem):
         self.label.setPos(label_x, label_y)
         
         # Calculate precise text dimensions using font metrics
-        font = self.label.font()
-        from PySide6.QtGui import QFontMetrics
-        metrics = QFontMetrics(font)
+        metrics = _label_metrics(self.label.font())
         text = self.label.toPlainText()
         lines = text.split('\n')
         
@@ -1227,12 +1246,10 @@ class PolygonROIItem(QGraphicsPolygonItem):
         for i, vertex_item in enumerate(self._vertex_items):
             if i == vertex_idx:
                 # Highlight this vertex
-                highlight_brush = QBrush(QColor(255, 150, 0, 220))  # Bright orange
-                vertex_item.setBrush(highlight_brush)
+                vertex_item.setBrush(_HANDLE_HIGHLIGHT_BRUSH)
             else:
                 # Normal color
-                normal_brush = QBrush(QColor(100, 150, 255, 180))
-                vertex_item.setBrush(normal_brush)
+                vertex_item.setBrush(_HANDLE_NORMAL_BRUSH)
 
     def itemChange(self, change, value):
         """
@@ -1493,9 +1510,7 @@ class PolygonROIItem(QGraphicsPolygonItem):
         self.label.setPos(label_x, label_y)
         
         # Calculate precise text dimensions using font metrics
-        font = self.label.font()
-        from PySide6.QtGui import QFontMetrics
-        metrics = QFontMetrics(font)
+        metrics = _label_metrics(self.label.font())
         text = self.label.toPlainText()
         lines = text.split('\n')
         
@@ -4,13 +4,12 @@ This module provides a customizable color bar legend widget that displays
 temperature scales with configurable palettes, orientations, and tick marks.
 """
 
-from PySide6.QtWidgets import QWidget, QSizePolicy as QSP
+from PySide6.QtWidgets import QApplication, QWidget, QSizePolicy as QSP
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPainter, QPixmap, QImage, QColor, QPen, QFontMetrics
+from PySide6.QtGui import QPainter, QPixmap, QPixmapCache, QImage, QColor, QPen, QFontMetrics
 import numpy as np
-import matplotlib.cm as cm
 
-from constants import PALETTE_MAP
+from constants import get_lut
 
 
 class ColorBarLegend(QWidget):
@@ -40,6 +39,10 @@ class ColorBarLegend(QWidget):
         self._precision = 1
         self._forced_text_color = None  # Force specific text color for exports
         
+        # Label font metrics, cached across repaints (see _font_metrics)
+        self._metrics_font = None
+        self._metrics = None
+        
         # Use smaller font for elegant appearance
         _f = self.font()
         try:
@@ -150,6 +153,18 @@ class ColorBarLegend(QWidget):
         self._forced_text_color = color
         self.update()
 
+    def _font_metrics(self) -> QFontMetrics:
+        """Return the label font metrics, rebuilt only when the font changes.
+        
+        Returns:
+            QFontMetrics: Metrics of the widget font the painter draws with.
+        """
+        font = self.font()
+        if self._metrics_font != font:
+            self._metrics_font = font
+            self._metrics = QFontMetrics(font)
+        return self._metrics
+
     def _make_bar_pixmap(self, height: int, width: int = 28) -> QPixmap:
         """Create a gradient bar pixmap with the current palette.
         
@@ -160,23 +175,38 @@ class ColorBarLegend(QWidget):
         Returns:
             QPixmap: The rendered gradient bar pixmap.
         """
-        cmap = PALETTE_MAP.get(self._palette, cm.inferno)
-        if self._orientation == Qt.Vertical:
+        # The gradient only depends on palette and geometry, so repaints for
+        # range or tick changes reuse the pixmap from Qt's global cache
+        vertical = self._orientation == Qt.Vertical
+        cache_key = f"colorbar:{self._palette}:{int(self._inverted)}:{int(vertical)}:{width}x{height}"
+        cached = QPixmapCache.find(cache_key)
+        if cached is not None and not cached.isNull():
+            return cached
+        
+        # Index the shared palette table the same way the colormap would
+        # (floor(x * N), clamped) instead of sampling matplotlib per size
+        lut = get_lut(self._palette)
+        n_colors = lut.shape[0]
+        if vertical:
             steps = max(2, height)
             grad = np.linspace(1.0, 0.0, steps).reshape(steps, 1)
             if self._inverted:
                 grad = 1.0 - grad
-            rgb = (cmap(grad)[:, :, :3] * 255).astype(np.uint8)  # (H,1,3)
+            rgb = lut[np.minimum((grad * n_colors).astype(np.intp), n_colors - 1)]  # (H,1,3)
             qimg = QImage(rgb.data, 1, steps, 3, QImage.Format_RGB888)
-            return QPixmap.fromImage(qimg).scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
         else:
             steps = max(2, width)
             grad = np.linspace(0.0, 1.0, steps).reshape(1, steps)
             if self._inverted:
                 grad = 1.0 - grad
-            rgb = (cmap(grad)[:, :, :3] * 255).astype(np.uint8)  # (1,W,3)
+            rgb = lut[np.minimum((grad * n_colors).astype(np.intp), n_colors - 1)]  # (1,W,3)
             qimg = QImage(rgb.data, steps, 1, steps * 3, QImage.Format_RGB888)
-            return QPixmap.fromImage(qimg).scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        # The gradient already has one sample per pixel along the bar, so the
+        # scale only replicates it across the bar: nearest-neighbour gives the
+        # same pixels as a bilinear resample without the filtering cost
+        pixmap = QPixmap.fromImage(qimg).scaled(width, height, Qt.IgnoreAspectRatio, Qt.FastTransformation)
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
 
     def paintEvent(self, _):
         """Handle the paint event to render the color bar legend.
@@ -193,7 +223,16 @@ class ColorBarLegend(QWidget):
         tick_len = 6
 
         full = self.rect()
-        fm = QFontMetrics(p.font())
+        fm = self._font_metrics()
+
+        # Use forced color for exports, or system color for UI; the pen is the
+        # same for every tick, so resolve the theme palette once per paint
+        if self._forced_text_color is not None:
+            text_color = self._forced_text_color
+        else:
+            palette = QApplication.palette()
+            text_color = palette.color(palette.ColorRole.Text)
+        text_pen = QPen(text_color, 1)
 
         if self._orientation == Qt.Vertical:
             bar_x = full.left() + margin
@@ -219,19 +258,10 @@ class ColorBarLegend(QWidget):
             else:
                 values = [vmin + i * (rng / (self._tick_count - 1)) for i in range(self._tick_count)]
                 values = values[::-1]  # Top to bottom labels as max ... min
+            p.setPen(text_pen)
             for idx, val in enumerate(values):
                 t = (val - vmin) / rng  # 0..1 bottom -> top mapping
                 y = int(bar_y + (1.0 - t) * bar_h)
-                
-                # Use forced color for exports, or system color for UI
-                if self._forced_text_color is not None:
-                    text_color = self._forced_text_color
-                else:
-                    # Use system text color for better theme compatibility
-                    from PySide6.QtWidgets import QApplication
-                    text_color = QApplication.palette().color(QApplication.palette().ColorRole.Text)
-                p.setPen(QPen(text_color, 1))
-                
                 p.drawLine(bar_x + bar_w, y, bar_x + bar_w + tick_len, y)
                 label = f"{val:.{self._precision}f}" + (f" {self._unit}" if self._show_units_on_ticks else "")
                 p.drawText(bar_x + bar_w + tick_len + label_gap, y + fm.ascent() // 2, label)
@@ -258,19 +288,10 @@ class ColorBarLegend(QWidget):
             else:
                 values = [vmin + i * (rng / (self._tick_count - 1)) for i in range(self._tick_count)]
             baseline = bar_y + bar_h + 8
+            p.setPen(text_pen)
             for val in values:
                 t = (val - vmin) / rng
                 x = int(bar_x + t * bar_w_pix)
-                
-                # Use forced color for exports, or system color for UI
-                if self._forced_text_color is not None:
-                    text_color = self._forced_text_color
-                else:
-                    # Use system text color for better theme compatibility
-                    from PySide6.QtWidgets import QApplication
-                    text_color = QApplication.palette().color(QApplication.palette().ColorRole.Text)
-                p.setPen(QPen(text_color, 1))
-                
                 p.drawLine(x, bar_y + bar_h, x, bar_y + bar_h + tick_len)
                 label = f"{val:.{self._precision}f}" + (f" {self._unit}" if self._show_units_on_ticks else "")
                 label_w = fm.horizontalAdvance(label)
@@ -1,9 +1,19 @@
+import logging
 from typing import Optional, List, Dict, Any
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QWidget, QStyleOptionGraphicsItem, QGraphicsPolygonItem, QMessageBox, QFileDialog, QApplication
-from PySide6.QtCore import Qt, QPointF, Signal, QRectF
+from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsPixmapItem, QWidget, QStyleOptionGraphicsItem, QGraphicsPolygonItem, QMessageBox, QFileDialog, QApplication
+from PySide6.QtCore import Qt, QPointF, Signal, QRectF, QTimer
 from PySide6.QtGui import QPixmap, QPainter, QWheelEvent, QMouseEvent, QTransform, QPen, QBrush, QColor, QPolygonF
 import numpy as np
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
+
+# Per-frame diagnostics; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
 
 class BlendablePixmapItem(QGraphicsPixmapItem):
     """Custom QGraphicsPixmapItem that supports blend modes.
@@ -20,6 +30,8 @@ class BlendablePixmapItem(QGraphicsPixmapItem):
         """
         super().__init__(parent)
         self._blend_mode = QPainter.CompositionMode_SourceOver
+        self._device_cache_enabled = True
+        self._update_cache_mode()
         
     def set_blend_mode(self, mode: QPainter.CompositionMode):
         """Set the blend mode for this item.
@@ -27,9 +39,34 @@ class BlendablePixmapItem(QGraphicsPixmapItem):
         Args:
             mode (QPainter.CompositionMode): The composition mode to use for blending.
         """
+        if mode == self._blend_mode:
+            return
         self._blend_mode = mode
+        self._update_cache_mode()
         self.update()
     
+    def set_device_cache_enabled(self, enabled: bool):
+        """Allow or forbid caching the item's rendering in device coordinates.
+        
+        Args:
+            enabled (bool): False to always paint the pixmap directly.
+        """
+        self._device_cache_enabled = bool(enabled)
+        self._update_cache_mode()
+    
+    def _update_cache_mode(self):
+        """Cache the scaled rendering unless a custom blend mode is active.
+        
+        With normal blending the scaled pixmap is rendered once per zoom
+        level and reused by every repaint (ROI drags, tooltips, opacity
+        changes). Other modes must composite against the items below at paint
+        time, which an item cache would bypass.
+        """
+        if self._device_cache_enabled and self._blend_mode == QPainter.CompositionMode_SourceOver:
+            self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        else:
+            self.setCacheMode(QGraphicsItem.NoCache)
+    
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None):
         """Override the paint method to apply the custom blend mode.
         
@@ -40,6 +77,11 @@ class BlendablePixmapItem(QGraphicsPixmapItem):
         """
         if self.pixmap().isNull():
             return
+        
+        # Normal blending is the painter's default: no state to swap
+        if self._blend_mode == QPainter.CompositionMode_SourceOver:
+            super().paint(painter, option, widget)
+            return
             
         # Store current state to restore after custom blending
         old_composition_mode = painter.compositionMode()
@@ -100,9 +142,20 @@ class ImageGraphicsView(QGraphicsView):
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
+
+        # Repaint only the regions touched by moving ROI items instead of the
+        # whole viewport, and cache the (static) background between frames.
+        # DontSavePainterState is safe because BlendablePixmapItem restores
+        # the composition mode it changes.
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+
         # Initialize scene
         self._scene = QGraphicsScene(self)
+        # The scene holds two pixmaps plus a handful of ROIs; a BSP tree costs
+        # more to maintain on every ROI move than a linear scan saves
+        self._scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self._scene)
         
         # Graphics items for images (order matters: visible below, thermal above)
@@ -112,6 +165,16 @@ class ImageGraphicsView(QGraphicsView):
         self._scene.addItem(self._visible_item)
         self._scene.addItem(self._thermal_item)
         
+        # The visible image is a static backdrop in overlay mode: keep it in a
+        # device-space pixmap cache so alpha/blend changes on the thermal layer
+        # only repaint the thermal item on top of it
+        self._visible_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
+        # Both images are opaque rectangles: hit tests under the mouse can use
+        # the bounding rect instead of deriving a shape from the pixmap mask
+        self._visible_item.setShapeMode(QGraphicsPixmapItem.BoundingRectShape)
+        self._thermal_item.setShapeMode(QGraphicsPixmapItem.BoundingRectShape)
+        
         # Overlay configuration
         self._overlay_mode = False
         self._overlay_alpha = 0.5
@@ -128,6 +191,9 @@ class ImageGraphicsView(QGraphicsView):
         # Prevent synchronization loops between multiple views
         self._is_sync_source = True
         
+        # Set by enable_opengl_viewport until the GL context has been checked
+        self._gl_check_pending = False
+        
         # Enable mouse tracking for temperature tooltips
         self.setMouseTracking(True)
         
@@ -164,6 +230,68 @@ class ImageGraphicsView(QGraphicsView):
         """
         self._allow_roi_drawing = allowed
 
+    def enable_opengl_viewport(self) -> bool:
+        """Render the view through a QOpenGLWidget viewport.
+
+        Moves pixmap transformation and overlay compositing to the GPU. The
+        view keeps its raster viewport if OpenGL is not available, and goes
+        back to it if no valid GL context exists once the view is shown (see
+        _verify_opengl_viewport). Note that Qt's GL engine only supports the
+        non-Porter-Duff blend modes with KHR_blend_equation_advanced.
+
+        Returns:
+            bool: True if the OpenGL viewport was installed, False otherwise.
+        """
+        if not OPENGL_AVAILABLE:
+            return False
+        try:
+            self.setViewport(QOpenGLWidget())
+            self._gl_check_pending = True
+            # A GL viewport redraws the whole frame anyway; partial updates
+            # and background caching only add overhead there
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+            self.setCacheMode(QGraphicsView.CacheNone)
+            # Item caches are rendered on the CPU and re-uploaded as textures
+            # at every zoom step; the GL engine keeps each pixmap as a texture
+            # and scales it on the GPU, so draw the images directly
+            self._visible_item.setCacheMode(QGraphicsItem.NoCache)
+            self._thermal_item.set_device_cache_enabled(False)
+            return True
+        except Exception as e:
+            print(f"⚠️ OpenGL viewport unavailable, using raster rendering: {e}")
+            return False
+
+    def showEvent(self, event):
+        """Check a freshly installed OpenGL viewport once the view is shown.
+        
+        Args:
+            event: Qt show event.
+        """
+        super().showEvent(event)
+        if self._gl_check_pending:
+            self._gl_check_pending = False
+            # The GL context is created when the viewport is first shown, so
+            # check it after this event has been processed
+            QTimer.singleShot(0, self._verify_opengl_viewport)
+
+    def _verify_opengl_viewport(self):
+        """Fall back to the raster viewport if the GL context is not valid."""
+        viewport = self.viewport()
+        if not OPENGL_AVAILABLE or not isinstance(viewport, QOpenGLWidget):
+            return
+        context = viewport.context()
+        if context is not None and context.isValid():
+            return
+        
+        print("⚠️ OpenGL context is not valid, using raster rendering")
+        self.setViewport(QWidget())
+        # Restore the raster settings from __init__
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        self._visible_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._thermal_item.set_device_cache_enabled(True)
+        self.setMouseTracking(True)
+
     def set_drawing_tool(self, tool: Optional[str]):
         """Set the current drawing tool.
         
@@ -194,8 +322,11 @@ class ImageGraphicsView(QGraphicsView):
         if pixmap is None or pixmap.isNull():
             self._thermal_item.setPixmap(QPixmap())
             return
-            
-        self._thermal_item.setPixmap(pixmap)
+        
+        # Re-setting the same image (e.g. to refit after a resize) keeps the
+        # item's cached rendering
+        if pixmap.cacheKey() != self._thermal_item.pixmap().cacheKey():
+            self._thermal_item.setPixmap(pixmap)
         
         # Auto-fit when setting new image, unless in overlay mode
         if not self._overlay_mode:
@@ -213,6 +344,11 @@ class ImageGraphicsView(QGraphicsView):
             self._visible_item.setPixmap(QPixmap())
             self._visible_item.setVisible(False)
             return
+        
+        # Same image already shown: keep the item cache instead of
+        # invalidating it with an identical pixmap
+        if pixmap.cacheKey() == self._visible_item.pixmap().cacheKey():
+            return
             
         self._visible_item.setPixmap(pixmap)
         # Don't automatically set visible here, update_overlay handles it
@@ -232,9 +368,44 @@ class ImageGraphicsView(QGraphicsView):
             offset (QPointF): Pixel offset for thermal image positioning.
             blend_mode (QPainter.CompositionMode, optional): Composition mode for blending.
         """
+        alpha = max(0.0, min(1.0, alpha))
+        scale = max(0.1, min(5.0, scale))
+        
+        # Opacity and blend mode are applied by the painter when the thermal
+        # item is composited (on the GPU with the OpenGL viewport), so if the
+        # layout is unchanged only the item state needs updating.
+        same_scale = visible and self._overlay_mode and scale == self._overlay_scale
+        # Offsets are in visible image pixels, which are scene units, so a
+        # pure alignment nudge only moves the thermal item: no re-layout and
+        # no refit that would discard the user's zoom and pan
+        both_images = (not self._visible_item.pixmap().isNull()
+                       and not self._thermal_item.pixmap().isNull())
+        offset_only = same_scale and offset != self._overlay_offset and both_images
+        # A scale change over a visible image only re-lays out the thermal
+        # item; the visible image placement and the view fit are unchanged
+        rescale_only = (visible and self._overlay_mode and both_images
+                        and scale != self._overlay_scale)
+        if rescale_only or (same_scale and (offset == self._overlay_offset or offset_only)):
+            if rescale_only:
+                self._overlay_scale = scale
+                self._overlay_offset = offset
+                self._place_thermal_over_visible()
+            elif offset_only:
+                delta = offset - self._overlay_offset
+                self._overlay_offset = offset
+                self._thermal_item.moveBy(delta.x(), delta.y())
+            self._overlay_alpha = alpha
+            self._visible_item.setVisible(not self._visible_item.pixmap().isNull())
+            self._thermal_item.setVisible(not self._thermal_item.pixmap().isNull())
+            self._thermal_item.setOpacity(alpha)
+            if blend_mode is not None:
+                self._blend_mode = blend_mode
+                self._thermal_item.set_blend_mode(blend_mode)
+            return
+        
         self._overlay_mode = visible
-        self._overlay_alpha = max(0.0, min(1.0, alpha))
-        self._overlay_scale = max(0.1, min(5.0, scale))
+        self._overlay_alpha = alpha
+        self._overlay_scale = scale
         self._overlay_offset = offset
         
         if blend_mode is not None:
@@ -284,9 +455,9 @@ class ImageGraphicsView(QGraphicsView):
         if not self._overlay_mode:
             return
         
-        print(f"🔧 _update_overlay_positioning called")
-        print(f"  - Overlay scale: {self._overlay_scale}")
-        print(f"  - Overlay offset: {self._overlay_offset}")
+        log.debug("🔧 _update_overlay_positioning called")
+        log.debug("  - Overlay scale: %s", self._overlay_scale)
+        log.debug("  - Overlay offset: %s", self._overlay_offset)
         
         # Reset transformations
         self._visible_item.setTransform(QTransform())
@@ -296,8 +467,8 @@ class ImageGraphicsView(QGraphicsView):
         if not self._visible_item.pixmap().isNull():
             visible_rect = self._visible_item.boundingRect()
             self._visible_item.setPos(-visible_rect.width()/2, -visible_rect.height()/2)
-            print(f"  - Visible image positioned at: {self._visible_item.pos()}")
-            print(f"  - Visible image rect: {visible_rect}")
+            log.debug("  - Visible image positioned at: %s", self._visible_item.pos())
+            log.debug("  - Visible image rect: %s", visible_rect)
             
             # Reset view and fit visible image
             self.resetTransform()
@@ -307,68 +478,7 @@ class ImageGraphicsView(QGraphicsView):
         # Position and scale thermal image relative to visible
         if not self._thermal_item.pixmap().isNull():
             if not self._visible_item.pixmap().isNull():
-                # Calculate relative scale based on actual image dimensions
-                thermal_pixmap = self._thermal_item.pixmap()
-                visible_pixmap = self._visible_item.pixmap()
-                
-                # Original dimensions
-                thermal_width = thermal_pixmap.width()
-                thermal_height = thermal_pixmap.height()
-                visible_width = visible_pixmap.width()
-                visible_height = visible_pixmap.height()
-                
-                print(f"  - Thermal original: {thermal_width}x{thermal_height}")
-                print(f"  - Visible original: {visible_width}x{visible_height}")
-                
-                # Calculate "natural" scale ratio if images were same size
-                natural_scale_x = visible_width / thermal_width if thermal_width > 0 else 1.0
-                natural_scale_y = visible_height / thermal_height if thermal_height > 0 else 1.0
-                natural_scale = min(natural_scale_x, natural_scale_y)
-                
-                print(f"  - Natural scale X: {natural_scale_x}")
-                print(f"  - Natural scale Y: {natural_scale_y}")
-                print(f"  - Natural scale: {natural_scale}")
-                
-                # Apply user scale multiplied by natural scale
-                final_scale = self._overlay_scale * natural_scale
-                print(f"  - Final scale: {final_scale}")
-                
-                # Apply transformation
-                transform = QTransform()
-                transform.scale(final_scale, final_scale)
-                self._thermal_item.setTransform(transform)
-                
-                # Calculate offsets in scene coordinates
-                thermal_rect = self._thermal_item.boundingRect()
-                scaled_thermal_rect = transform.mapRect(thermal_rect)
-                
-                print(f"  - Thermal rect before transform: {thermal_rect}")
-                print(f"  - Thermal rect after transform: {scaled_thermal_rect}")
-                
-                # Offsets are provided in original visible image pixels
-                # Must convert to scene coordinates
-                visible_rect = self._visible_item.boundingRect()
-                
-                # Calculate ratio between scene item size and original image
-                scale_x = visible_rect.width() / visible_width
-                scale_y = visible_rect.height() / visible_height
-                
-                print(f"  - Scene scale X: {scale_x}")
-                print(f"  - Scene scale Y: {scale_y}")
-                
-                # Convert offsets from visible image pixels to scene coordinates
-                offset_x_scene = self._overlay_offset.x() * scale_x
-                offset_y_scene = self._overlay_offset.y() * scale_y
-                
-                print(f"  - Scene offsets: ({offset_x_scene}, {offset_y_scene})")
-                
-                # Position thermal image centered plus offset
-                pos_x = -scaled_thermal_rect.width()/2 + offset_x_scene
-                pos_y = -scaled_thermal_rect.height()/2 + offset_y_scene
-                
-                print(f"  - Thermal final position: ({pos_x}, {pos_y})")
-                
-                self._thermal_item.setPos(pos_x, pos_y)
+                self._place_thermal_over_visible()
             else:
                 # If no visible image, center thermal
                 transform = QTransform()
@@ -384,6 +494,75 @@ class ImageGraphicsView(QGraphicsView):
                 self.fitInView(self._thermal_item, Qt.KeepAspectRatio)
                 self._zoom_factor = self.transform().m11()
     
+    def _place_thermal_over_visible(self):
+        """Scale and position the thermal item over the visible image.
+        
+        Only the thermal item is touched, so the visible image placement and
+        the view's zoom and pan are kept.
+        """
+        # Calculate relative scale based on actual image dimensions
+        thermal_pixmap = self._thermal_item.pixmap()
+        visible_pixmap = self._visible_item.pixmap()
+        
+        # Original dimensions
+        thermal_width = thermal_pixmap.width()
+        thermal_height = thermal_pixmap.height()
+        visible_width = visible_pixmap.width()
+        visible_height = visible_pixmap.height()
+        
+        log.debug("  - Thermal original: %sx%s", thermal_width, thermal_height)
+        log.debug("  - Visible original: %sx%s", visible_width, visible_height)
+        
+        # Calculate "natural" scale ratio if images were same size
+        natural_scale_x = visible_width / thermal_width if thermal_width > 0 else 1.0
+        natural_scale_y = visible_height / thermal_height if thermal_height > 0 else 1.0
+        natural_scale = min(natural_scale_x, natural_scale_y)
+        
+        log.debug("  - Natural scale X: %s", natural_scale_x)
+        log.debug("  - Natural scale Y: %s", natural_scale_y)
+        log.debug("  - Natural scale: %s", natural_scale)
+        
+        # Apply user scale multiplied by natural scale
+        final_scale = self._overlay_scale * natural_scale
+        log.debug("  - Final scale: %s", final_scale)
+        
+        # Apply transformation
+        transform = QTransform()
+        transform.scale(final_scale, final_scale)
+        self._thermal_item.setTransform(transform)
+        
+        # Calculate offsets in scene coordinates
+        thermal_rect = self._thermal_item.boundingRect()
+        scaled_thermal_rect = transform.mapRect(thermal_rect)
+        
+        log.debug("  - Thermal rect before transform: %s", thermal_rect)
+        log.debug("  - Thermal rect after transform: %s", scaled_thermal_rect)
+        
+        # Offsets are provided in original visible image pixels
+        # Must convert to scene coordinates
+        visible_rect = self._visible_item.boundingRect()
+        
+        # Calculate ratio between scene item size and original image
+        scale_x = visible_rect.width() / visible_width
+        scale_y = visible_rect.height() / visible_height
+        
+        log.debug("  - Scene scale X: %s", scale_x)
+        log.debug("  - Scene scale Y: %s", scale_y)
+        
+        # Convert offsets from visible image pixels to scene coordinates
+        offset_x_scene = self._overlay_offset.x() * scale_x
+        offset_y_scene = self._overlay_offset.y() * scale_y
+        
+        log.debug("  - Scene offsets: (%s, %s)", offset_x_scene, offset_y_scene)
+        
+        # Position thermal image centered plus offset
+        pos_x = -scaled_thermal_rect.width()/2 + offset_x_scene
+        pos_y = -scaled_thermal_rect.height()/2 + offset_y_scene
+        
+        log.debug("  - Thermal final position: (%s, %s)", pos_x, pos_y)
+        
+        self._thermal_item.setPos(pos_x, pos_y)
+        
     def zoom_in(self, factor: float = 1.2):
         """Zoom in with specified factor.
         
@@ -571,13 +750,15 @@ class ImageGraphicsView(QGraphicsView):
             pixmap_size = self.get_current_pixmap_size()
             self.view_transformed.emit(self._zoom_factor, self.get_pan_offset(), pixmap_size)
         
-        # Calculate coordinates on thermal map
-        if not self._thermal_item.pixmap().isNull():
+        # Calculate coordinates on thermal map. The item's bounding rect is
+        # the pixmap rect (empty without one), so this reads the current
+        # layout without fetching the pixmap on every event
+        thermal_rect = self._thermal_item.boundingRect()
+        if not thermal_rect.isEmpty():
             scene_pos = self.mapToScene(event.pos())
             thermal_pos = self._thermal_item.mapFromScene(scene_pos)
             
             # Convert to original image coordinates
-            thermal_rect = self._thermal_item.boundingRect()
             if thermal_rect.contains(thermal_pos):
                 # Emit signal with coordinates relative to image
                 self.mouse_moved_on_thermal.emit(thermal_pos)
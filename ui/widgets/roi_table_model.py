@@ -0,0 +1,152 @@
+"""Table model exposing ROI names, emissivities and statistics.
+
+This module provides the item model behind the ROI analysis table. It reads
+ROI properties and the controller's statistics array directly, so refreshing
+the table only notifies the view instead of rebuilding per-cell items.
+"""
+
+import logging
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide6.QtWidgets import QApplication
+import numpy as np
+
+# Edit messages; enable with logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class RoiTableModel(QAbstractTableModel):
+    """Item model wrapping the ROIs held by an ROIController.
+
+    Columns 0 and 1 (name and emissivity) are editable and write back through
+    the controller; the temperature statistics columns are read-only.
+    """
+
+    HEADERS = ("Name", "Emissivity", "Min (°C)", "Max (°C)", "Mean (°C)", "Median (°C)")
+
+    # Maps the statistics columns to their field in the controller's array
+    STAT_COLUMNS = {2: 0, 3: 1, 4: 2, 5: 4}
+    
+    # Item flags are per column only, so they are combined once here
+    READONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    EDITABLE_FLAGS = READONLY_FLAGS | Qt.ItemIsEditable
+
+    # Emitted with the ROI model after a name or emissivity edit is applied
+    roi_edited = Signal(object)
+    # Emitted with (title, message) when an edit is rejected
+    edit_rejected = Signal(str, str)
+
+    def __init__(self, roi_controller, parent=None):
+        """Initialize the model.
+
+        Args:
+            roi_controller: ROIController providing the ROIs and statistics.
+            parent: Parent object, defaults to None.
+        """
+        super().__init__(parent)
+        self._controller = roi_controller
+        self._rois = []
+        self._stats = np.empty((0, 0))
+        self._readonly_brush = None
+
+    def refresh(self):
+        """Re-read ROIs and statistics from the controller and notify views.
+
+        A changed ROI count resets the model; otherwise only a single
+        dataChanged covering the whole table is emitted.
+        """
+        rois = self._controller.get_all_rois()
+        stats = self._controller.get_statistics_array()
+        # Background for read-only cells, looked up once per refresh
+        self._readonly_brush = QApplication.palette().window()
+
+        if len(rois) != len(self._rois):
+            self.beginResetModel()
+            self._rois, self._stats = rois, stats
+            self.endResetModel()
+        else:
+            self._rois, self._stats = rois, stats
+            if rois:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(rois) - 1, len(self.HEADERS) - 1),
+                )
+
+    def roi_at(self, row: int):
+        """Return the ROI shown in the given row, or None if out of range.
+
+        Args:
+            row (int): Table row.
+        """
+        if 0 <= row < len(self._rois):
+            return self._rois[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rois)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self.EDITABLE_FLAGS if index.column() < 2 else self.READONLY_FLAGS
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        roi = self._rois[row]
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == 0:
+                return roi.name
+            if col == 1:
+                return f"{getattr(roi, 'emissivity', 0.95):.3f}"
+            value = self._stats[row, self.STAT_COLUMNS[col]]
+            return "N/A" if np.isnan(value) else f"{value:.2f}"
+        if role == Qt.BackgroundRole and col >= 2:
+            return self._readonly_brush
+        if role == Qt.UserRole:
+            return roi.id
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        roi = self.roi_at(index.row())
+        if roi is None:
+            return False
+        col = index.column()
+
+        if col == 0:
+            new_name = str(value).strip()
+            if not new_name:
+                return False
+            self._controller.update_roi(roi.id, name=new_name)
+            log.debug("Updated ROI name to: %s", new_name)
+        elif col == 1:
+            try:
+                new_emissivity = float(value)
+            except (TypeError, ValueError):
+                self.edit_rejected.emit("Invalid Emissivity",
+                                        "Please enter a valid number for emissivity")
+                return False
+            if not 0.0 <= new_emissivity <= 1.0:
+                self.edit_rejected.emit("Invalid Emissivity",
+                                        "Emissivity must be between 0.0 and 1.0")
+                return False
+            self._controller.update_roi(roi.id, emissivity=new_emissivity)
+            log.debug("Updated ROI emissivity to: %s", new_emissivity)
+        else:
+            return False
+
+        self.dataChanged.emit(index, index)
+        self.roi_edited.emit(roi)
+        return True